@@ -1,5 +1,5 @@
-import pygame
 from pygame.sprite import Sprite
+from assets import cache
 
 
 class Alien(Sprite):
@@ -12,9 +12,11 @@ class Alien(Sprite):
         self.screen = ai_game.screen
         self.settings = ai_game.settings
 
-        # загрузка изображения пришельца и назначение атрибута rect
-        self.image = pygame.image.load('images/alien.bmp')
+        # изображение пришельца берется из общего кэша и назначается атрибут rect
+        self.image = cache.get_image('images/alien.bmp')
         self.rect = self.image.get_rect()
+        # маска пикселов для точных столкновений общая у всех пришельцев
+        self.mask = cache.get_mask('images/alien.bmp')
 
         # каждый новый пришелец появляется в левом верхнем углу экрана
         self.rect.x = self.rect.width
@@ -23,14 +25,21 @@ class Alien(Sprite):
         # сохранение точной горизонтальной позиции пришельца
         self.x = float(self.rect.x)
 
-    def check_edges(self):
-        """Возвращает True, если пришелец находится у края экрана"""
-        screen_rect = self.screen.get_rect()
-        if self.rect.right >= screen_rect.right or self.rect.left <= 0:
-            return True
-
-    def update(self):
-        """Перемещает пришельца вправо"""
-        self.x += self.settings.alien_speed * self.settings.fleet_direction
+    def copy_at(self, x, y):
+        """Возвращает нового пришельца с тем же изображением в позиции (x, y)"""
+        # __init__ не вызывается: изображение и настройки берутся у прототипа.
+        alien = Alien.__new__(Alien)
+        Sprite.__init__(alien)
+        alien.screen = self.screen
+        alien.settings = self.settings
+        alien.image = self.image
+        alien.mask = self.mask
+        alien.rect = self.rect.move(x - self.rect.x, y - self.rect.y)
+        alien.x = float(x)
+        return alien
+
+    def update(self, dt):
+        """Перемещает пришельца вправо или влево за dt секунд"""
+        self.x += self.settings.alien_speed * self.settings.fleet_direction * dt
         self.rect.x = self.x
 
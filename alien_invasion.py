@@ -1,30 +1,66 @@
-import sys
-from time import sleep
+import time
+
+# Время импорта модулей игры входит в отчет о запуске.
+_import_started = time.perf_counter()
+
+import argparse
+import os
+from collections import deque
 import pygame
 from settings import Settings
-from game_stats import GameStats
+from game_stats import GameStats, GAME_OVER, PLAYING, RESPAWNING
 from scoreboard import Scoreboard
 from button import Button
 from ship import Ship
-from bullet import Bullet
+from bullet_pool import BulletPool
 from alien import Alien
+from fleet import Fleet, fleet_layout
+from timing import RateCounter, StartupTimer
+from renderer import DirtyRenderer
+from display import Display, SCALING_MODES
+from render_queue import RenderQueue, SpriteAtlas
+from replay import InputRecorder
+from profiler import FrameProfiler
+from alloc_tracker import AllocationTracker
+from snapshot import SnapshotRing
+from controls import Controls
+from assets import cache, GAME_IMAGES
+
+_import_time = time.perf_counter() - _import_started
 
 
 class AlienInvasion:
     """Класс для управления ресурсами и поведение игры"""
 
-    def __init__(self):
-        """Инициализируем игру и создает игровые ресурсы"""
-        pygame.init()
-        self.settings = Settings()  # создаем экзепляр класса Settings
-
-        #  Создаем окно (поверхность), в котором прорисавываются все графические элементы игры.
-        #  При создании экрана используются FULLSCREEN, вычисляющий размер окна
-        #  атрибуты screen_width и screen_height используются для обновления объекта self.settings
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        self.settings.screen_width = self.screen.get_rect().width
-        self.settings.screen_height = self.screen.get_rect().height
+    def __init__(self, settings=None, headless=False):
+        """Инициализируем игру и создает игровые ресурсы.
+
+        В режиме headless окно не открывается: используется драйвер SDL dummy,
+        а игра продвигается вызовами step() без отрисовки.
+        """
+        self.startup = StartupTimer()
+        self.startup.add('import', _import_time)
+
+        self.headless = headless
+        if headless:
+            os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+        # Изображения читаются с диска в фоновом потоке, пока создается окно.
+        cache.preload(GAME_IMAGES)
+
+        # Игре нужны только экран и шрифты; звук и джойстики не инициализируются.
+        pygame.display.init()
+        pygame.font.init()
+        # создаем экзепляр класса Settings, если настройки не переданы
+        self.settings = settings if settings is not None else Settings()
+        self.startup.mark('init')
+
+        #  Создаем окно и поверхность self.screen, в которой прорисавываются все графические
+        #  элементы игры. Ее размер зависит от Settings.display_scaling (см. display.py).
+        self.display = Display(self.settings, headless)
+        self.screen = self.display.screen
         pygame.display.set_caption("Alien Invasion")
+        self.startup.mark('display')
 
         # Создание экземпляров для хранения статистики и панели результатов.
         self.stats = GameStats(self)
@@ -34,120 +70,239 @@ class AlienInvasion:
         self.bg_color = (230, 230, 230)
 
         self.ship = Ship(self)
-        self.bullets = pygame.sprite.Group()
-        self.aliens = pygame.sprite.Group()
+        self.bullets = BulletPool(self, self.settings.bullets_allowed)
+        self.aliens = self._make_fleet()
+
+        # Прототип, с которого копируются пришельцы нового флота, и очередь
+        # позиций пришельцев, которые еще не появились на экране.
+        self.alien_prototype = Alien(self)
+        self.spawn_queue = deque()
 
         self._create_fleet()  # вспомогательный метод для создания флота
 
         # Создание кнопки Play.
         self.play_button = Button(self, "Play")
 
-    def run_game(self):
-        """Запуск основного цикла игры"""
-        while True:
-            self._check_events()  # вспомогательный метод
+        # Корабль, пришелец и снаряд рисуются из одного атласа одним вызовом blits().
+        atlas = SpriteAtlas([self.ship.image, self.alien_prototype.image, self.bullets.image])
+        self.render_queue = RenderQueue(self.screen, atlas)
 
-            if self.stats.game_active:
-                # позиция корабля будет обновляться после проверки событий клавиатуры,
-                # но перед обновление экрана
-                self.ship.update()
+        # При render_mode = 'dirty' кадр обновляется по изменившимся областям.
+        self.dirty_renderer = None
+        if self.settings.render_mode == 'dirty':
+            self.dirty_renderer = DirtyRenderer(self)
+        self.startup.mark('assets')
 
-                # вспомогательные методы
-                self._update_bullets()
-                self._update_screen()
-                self._update_aliens()
+        # Часы ограничивают частоту кадров, счетчик сообщает фактические частоты.
+        self.clock = pygame.time.Clock()
+        self.rates = RateCounter()
 
-            # Без этого блока вместо кнопки появляется черный экран (в книге этого кода нет!)
-            else:
-                self._update_screen()
+        # Замер этапов кадра; панель включается клавишей F3.
+        self.profiler = FrameProfiler(self)
 
+        # Снимки состояния для перемотки назад клавишей Backspace.
+        self.snapshots = None
+        if self.settings.rewind_interval and not self.settings.record_path:
+            self.snapshots = SnapshotRing(self, self.settings.rewind_interval,
+                                          self.settings.rewind_memory)
 
-    def _check_events(self):
-        """Обрабатывает нажатия клавиш и события мыши"""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                sys.exit()
-            elif event.type == pygame.KEYDOWN:
-                self._check_keydown_events(event)
-            elif event.type == pygame.KEYUP:
-                self._check_keyup_events(event)
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = pygame.mouse.get_pos()
-                self._check_play_button(mouse_pos)
-
-    def _check_play_button(self, mouse_pos):
-        """Запускает новую игру при нажатии кнопки Play."""
-        button_clicked = self.play_button.rect.collidepoint(mouse_pos)
-        if button_clicked and not self.stats.game_active:
-            # Сброс игровых настроек.
-            self.settings.initialize_dynamic_settings()
-            self.stats.reset_stats()
-            self.stats.game_active = True
-            self.sb.prep_score()
-            self.sb.prep_level()
-            self.sb.prep_ships()
+        # Ввод с клавиатуры и мыши по таблице Settings.key_bindings.
+        self.controls = Controls(self)
+        # Сколько тиков осталось до следующего выстрела удержанием клавиши.
+        self.fire_cooldown_ticks = 0
 
-            # Очистка списков пришельцев и снарядов.
-            self.aliens.empty()
-            self.bullets.empty()
+    def run_game(self):
+        """Запуск основного цикла игры с фиксированным шагом симуляции"""
+        tick_dt = 1 / self.settings.tick_rate
+        accumulator = 0.0
+
+        # Если задан record_path, действия каждого тика записываются для replay.py.
+        recorder = None
+        if self.settings.record_path:
+            recorder = InputRecorder(self)
+
+        # Если задан alloc_interval, рост памяти по кадрам отслеживается через tracemalloc.
+        tracker = None
+        if self.settings.alloc_interval:
+            tracker = AllocationTracker(self.settings.alloc_interval)
+            tracker.start()
+
+        try:
+            while True:
+                self.profiler.begin_frame()
+
+                # Clock.tick ждет, чтобы не превысить fps_limit, и возвращает время кадра в мс.
+                frame_time = self.clock.tick(self.settings.fps_limit) / 1000
+                accumulator += min(frame_time, self.settings.max_frame_time)
+                self.profiler.mark('wait')
+
+                self._check_events()  # вспомогательный метод
+                self.profiler.mark('events')
+
+                # Накопленное время расходуется шагами одинаковой длины,
+                # поэтому скорость игры не зависит от производительности машины.
+                while accumulator >= tick_dt:
+                    actions = self.controls.sample()
+                    if recorder is not None:
+                        recorder.record(actions)
+                    self.step(actions)
+                    if self.snapshots is not None and self.stats.game_active:
+                        self.snapshots.record()
+                    accumulator -= tick_dt
+                    self.rates.count_tick()
 
-            # Создание нового флота и размещение корабля в центре.
-            self._create_fleet()
-            self.ship.center_ship()
+                self._update_screen()
+                self.profiler.end_frame()
+                if tracker is not None:
+                    tracker.frame()
+                if 'first_frame' not in self.startup.stages:
+                    self._report_startup()
+                if self.rates.count_frame():
+                    self._report_rates()
+        finally:
+            if recorder is not None:
+                recorder.save(self.settings.record_path)
+            self.profiler.close()
+            if tracker is not None:
+                tracker.stop()
+                for line in tracker.report():
+                    print(line)
+
+    def step(self, actions=()):
+        """Продвигает игру на один тик симуляции без отрисовки и опроса событий.
+
+        actions - набор названий действий: 'left', 'right', 'up', 'down',
+        'fire' (выстрел по нажатию), 'hold_fire' (стрельба удержанием,
+        не чаще раза в fire_cooldown секунд) и 'play' (запуск новой игры).
+        """
+        self.ship.moving_left = 'left' in actions
+        self.ship.moving_right = 'right' in actions
+        self.ship.moving_up = 'up' in actions
+        self.ship.moving_down = 'down' in actions
+
+        if 'play' in actions and not self.stats.game_active:
+            self._start_game()
+
+        dt = 1 / self.settings.tick_rate
+        if self.stats.state == RESPAWNING:
+            self._update_respawn(dt)
+        elif self.stats.game_active:
+            # Каждое нажатие стреляет сразу, а удерживаемая клавиша - не чаще
+            # раза в fire_cooldown секунд; интервал считается в целых тиках.
+            if self.fire_cooldown_ticks:
+                self.fire_cooldown_ticks -= 1
+            if 'fire' in actions:
+                fired = self.fire_bullet()
+            else:
+                fired = ('hold_fire' in actions and not self.fire_cooldown_ticks
+                         and self.fire_bullet())
+            if fired:
+                self.fire_cooldown_ticks = round(self.settings.fire_cooldown
+                                                 * self.settings.tick_rate)
+            self._update_game(dt)
+
+    def _update_game(self, dt):
+        """Выполняет один шаг симуляции длиной dt секунд"""
+        # позиция корабля будет обновляться после проверки событий клавиатуры,
+        # но перед обновление экрана
+        self.ship.update(dt)
+        self.profiler.mark('ship')
+
+        # вспомогательные методы
+        self._update_bullets(dt)
+        self.profiler.mark('bullets')
+        self._update_aliens(dt)
+        self.profiler.mark('aliens')
+
+    def _update_respawn(self, dt):
+        """Отсчитывает паузу после потери корабля и возвращает игру в состояние PLAYING"""
+        self.stats.respawn_timer -= dt
+        if self.stats.respawn_timer <= 0:
+            self.stats.respawn_timer = 0.0
+            self.stats.state = PLAYING
+
+    def ship_visible(self):
+        """Возвращает False в те моменты паузы, когда мигающий корабль скрыт"""
+        if self.stats.state != RESPAWNING:
+            return True
+        return int(self.stats.respawn_timer / self.settings.respawn_blink) % 2 == 1
+
+    def rewind(self):
+        """Возвращает игру к предыдущему снимку состояния"""
+        if self.snapshots is not None and self.snapshots.rewind():
+            pygame.mouse.set_visible(not self.stats.game_active)
+
+    def _report_startup(self):
+        """Запоминает время первого кадра и при необходимости выводит отчет о запуске"""
+        self.startup.mark('first_frame')
+        if self.settings.startup_report:
+            for line in self.startup.report(self.settings.startup_budget):
+                print(line)
+
+    def _report_rates(self):
+        """Выводит фактические частоты тиков и кадров в заголовок окна"""
+        pygame.display.set_caption(
+            f"Alien Invasion - {self.rates.tick_rate:.0f} ticks/s, "
+            f"{self.rates.frame_rate:.0f} fps")
 
-            # Указатель мыши скрывается.
-            pygame.mouse.set_visible(False)
-
-    def _check_keydown_events(self, event):
-        """Реагирует на нажатие клавиши"""
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = True
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = True
-        elif event.key == pygame.K_UP:
-            self.ship.moving_up = True
-        elif event.key == pygame.K_DOWN:
-            self.ship.moving_down = True
-        elif event.key == pygame.K_q:
-            sys.exit()
-        elif event.key == pygame.K_SPACE:
-            self.fire_bullet()
-
-    def _check_keyup_events(self, event):
-        """Реагирует на отпускание клавиши"""
-        if event.key == pygame.K_RIGHT:
-            self.ship.moving_right = False
-        elif event.key == pygame.K_LEFT:
-            self.ship.moving_left = False
-        elif event.key == pygame.K_UP:
-            self.ship.moving_up = False
-        elif event.key == pygame.K_DOWN:
-            self.ship.moving_down = False
+
+    def _check_events(self):
+        """Обрабатывает нажатия клавиш и события мыши"""
+        self.controls.handle_events()
+
+    def _make_fleet(self):
+        """Создает группу флота выбранного в настройках типа"""
+        if self.settings.fleet_engine == 'numpy':
+            # numpy нужен только для этого режима, поэтому импортируется здесь.
+            from array_fleet import ArrayFleet
+            return ArrayFleet(self.settings)
+        return Fleet(self.settings)
+
+    def _start_game(self):
+        """Начинает новую игру со сброшенной статистикой."""
+        # Сброс игровых настроек.
+        self.settings.initialize_dynamic_settings()
+        self.stats.reset_stats()
+        self.stats.game_active = True
+        self.sb.prep_score()
+        self.sb.prep_level()
+        self.sb.prep_ships()
+
+        # Очистка списков пришельцев и снарядов.
+        self.aliens.empty()
+        self.bullets.empty()
+        self.fire_cooldown_ticks = 0
+        # Перемотка не возвращает в предыдущую игру.
+        if self.snapshots is not None:
+            self.snapshots.clear()
+
+        # Создание нового флота и размещение корабля в центре.
+        self._create_fleet()
+        self.ship.center_ship()
+
+        # Указатель мыши скрывается.
+        pygame.mouse.set_visible(False)
 
     def fire_bullet(self):
-        """Создание нового снаряяда и включение его в группу bullets"""
+        """Создание нового снаряяда и включение его в группу bullets; возвращает True при выстреле"""
         if len(self.bullets) < self.settings.bullets_allowed:
-            new_bullet = Bullet(self)
-            self.bullets.add(new_bullet)
+            self.bullets.fire(self.ship.rect.midtop)
+            return True
+        return False
 
-    def _update_bullets(self):
+    def _update_bullets(self, dt):
         """Обновляет позиции снарядов и уничтожает старые снаряды"""
-        self.bullets.update()  # позиция снаряда будет обновляться при каждом проходе цикла
+        self.bullets.update(dt)  # позиция снаряда будет обновляться при каждом шаге симуляции
 
         # удаление снарядов, вышедших за край экрана
-        for bullet in self.bullets.copy():
-            if (bullet.rect.bottom <= 0) \
-                    or (bullet.rect.left >= self.ship.screen_rect.right) \
-                    or (bullet.rect.right <= 0):
-                self.bullets.remove(bullet)
+        self.bullets.cull(self.ship.screen_rect)
 
         self._check_bullet_alien_collisions()
 
     def _check_bullet_alien_collisions(self):
         # Проверка попаданий в пришельцев.
         # При обнаружении попадания улить снаряд и пришельца.
-        collisions = pygame.sprite.groupcollide(
-            self.bullets, self.aliens, True, True)
+        collisions = self.aliens.collide_bullets(self.bullets)
 
         if collisions:
             for alien in collisions.values():
@@ -155,7 +310,7 @@ class AlienInvasion:
             self.sb.prep_score()
             self.sb.check_high_score()
 
-        if not self.aliens:
+        if not self.aliens and not self.spawn_queue:
             # Уничтожение существующих снарядов и создание нового флота.
             # Сразу после уничтожения текущего флота на экране появляется новый флот.
             self.bullets.empty()
@@ -181,21 +336,27 @@ class AlienInvasion:
             self._create_fleet()
             self.ship.center_ship()
 
-            # Пауза.
-            sleep(0.5)
+            # Пауза отсчитывается тиками симуляции, корабль в это время мигает.
+            # Цикл продолжает обрабатывать события и рисовать кадры.
+            self.stats.state = RESPAWNING
+            self.stats.respawn_timer = self.settings.respawn_time
         else:
-            self.stats.game_active = False
+            self.stats.state = GAME_OVER
             # Когда игра становится неактивной, появляется указатель мыши
             pygame.mouse.set_visible(True)
 
-    def _update_aliens(self):
+    def _update_aliens(self, dt):
         """Проверяет, достиг ли флот края экрана,
             с последиющим обновлением позиций всех пришельцев во флоте"""
-        self._check_fleet_edges()
-        self.aliens.update()
+        if self.spawn_queue:
+            # Пока флот появляется по рядам, он стоит на месте.
+            self._spawn_aliens()
+        else:
+            self._check_fleet_edges()
+            self.aliens.update(dt)
 
         # Проверка коллизий "пришелец - корабль"
-        if pygame.sprite.spritecollideany(self.ship, self.aliens):
+        if self.aliens.collide_sprite(self.ship):
             self._ship_hit()
 
         # Проверить, добрались ли пришельцы до нижнего края экрана.
@@ -204,85 +365,111 @@ class AlienInvasion:
     def _check_aliens_bottom(self):
         """Проверяет, добрались ли пришельцы до нижнего края экрана."""
         screen_rect = self.screen.get_rect()
-        for alien in self.aliens.sprites():
-            if alien.rect.bottom >= screen_rect.bottom:
-                # Происходит то же, что при столкновении с кораблем.
-                self._ship_hit()
-                break
+        if self.aliens.reached_bottom(screen_rect.bottom):
+            # Происходит то же, что при столкновении с кораблем.
+            self._ship_hit()
 
     def _create_fleet(self):
         """Создание флота вторжения"""
-        alien = Alien(self)  # создание пришельца, он не войдет во флот и не включается в группу aliens
-        alien_width, alien_height = alien.rect.size  # size содержит кортеж с шириной и высотой объекта rect
-
-        # Вычисляется доступное горизонтальное пространство и количество пришельцев, которые в нем поместятся.
-        # Интервал между соседними пришельцами равен ширине пришельца.
-        available_space_x = self.settings.screen_width - (2 * alien_width)
-        number_aliens_x = available_space_x // (2 * alien_width)  # количество пришельцев в ряду
-
-        # Определяет количество рядов, помещающихся на экране.
-        ship_height = self.ship.rect.height
-        available_space_y = self.settings.screen_height - (3 * alien_height) - ship_height
-        number_rows = available_space_y // (2 * alien_height)
-
-        # Создание флота
-        for row_number in range(number_rows):
-            for alien_number in range(number_aliens_x):
-                self._create_alien(alien_number, row_number)
-
-    def _create_alien(self, alien_number, row_number):
-        """Создание пришельца и размещение его в ряду"""
-        alien = Alien(self)  # создается новый пришелец
-        alien_width, alien_height = alien.rect.size
-
-        # Пришелец сдвигается вправо на одну ширину от левого края поля.
-        # 2 * alien_width - полное пространство выделенное на одного пришельца (две ширины пришельца)
-        alien.x = alien_width + 2 * alien_width * alien_number
-        alien.rect.x = alien.x
-
-        # Прибавляется одна высота пришельца, чтобы создать пустое место у вехнего края экрана.
-        # Каждый новый ряд начинается на две высоты ниже последнего ряда - 2 * alien.rect.height
-        # Номер первого ряда равен 0
-        alien.rect.y = alien.rect.height + 2 * alien.rect.height * row_number
-        self.aliens.add(alien)  # новый пришелец добавляется в группу
+        alien_width, alien_height = self.alien_prototype.rect.size
+        positions = fleet_layout(self.settings.screen_width, self.settings.screen_height,
+                                 alien_width, alien_height, self.ship.rect.height)
+
+        # При fleet_spawn_batch > 0 флот появляется по частям в следующих тиках.
+        self.spawn_queue.clear()
+        if self.settings.fleet_spawn_batch:
+            self.spawn_queue.extend(positions)
+        else:
+            self._add_aliens(positions)
+
+    def _add_aliens(self, positions):
+        """Создание пришельцев копированием прототипа и добавление их во флот"""
+        prototype = self.alien_prototype
+        self.aliens.add([prototype.copy_at(x, y) for x, y in positions])
+
+    def _spawn_aliens(self):
+        """Выводит на экран очередную часть флота из очереди"""
+        count = min(self.settings.fleet_spawn_batch, len(self.spawn_queue))
+        self._add_aliens([self.spawn_queue.popleft() for _ in range(count)])
 
     def _check_fleet_edges(self):
         """Реагирует на достижение пришельцем края экрана"""
-        for alien in self.aliens.sprites():
-            if alien.check_edges():
-                self._change_fleet_direction()
-                break
+        if self.aliens.check_edges(self.screen.get_rect()):
+            self._change_fleet_direction()
 
     def _change_fleet_direction(self):
         """Опускает весь флот и меняет направление флота"""
-        for alien in self.aliens.sprites():
-            alien.rect.y += self.settings.fleet_drop_speed
+        self.aliens.drop(self.settings.fleet_drop_speed)
         self.settings.fleet_direction *= -1
 
     def _update_screen(self):
         """Обновляет изображения на экране и отображает новый экран"""
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.update_screen()
+            return
+
         #  При каждом проходе цикла перерисовывается экран
         #  Для получения цвета фона при заполнении экрана используется объект self.settings
         self.screen.fill(self.settings.bg_color)
+        self.draw_frame()
 
-        self.ship.blitne()
-        for bullet in self.bullets.sprites():
-            bullet.draw_bullet()
-        self.aliens.draw(self.screen)  # вызов метода draw для появления пришельца на экране
-
-        # Вывод информации о счете
-        self.sb.show_score()
+        #  Отображение последнего прорисованного экрана
+        self.display.present()
+        self.profiler.mark('flip')
+
+    def draw_frame(self):
+        """Рисует все элементы кадра и возвращает занятые ими прямоугольники"""
+        # Корабль, снаряды, пришельцы и панель счета собираются в очередь
+        # и выводятся одним пакетом.
+        queue = self.render_queue
+        if self.ship_visible():
+            queue.add(self.ship.image, self.ship.rect)
+        queue.add_many(self.bullets.image, [bullet.rect for bullet in self.bullets.active])
+        self.aliens.queue_draw(queue)
+        if self.profiler.enabled:
+            # При замерах панель счета выводится отдельным blits(), чтобы этап
+            # score учитывал ее настоящий вывод, а не только постановку в очередь.
+            rects = queue.flush()
+            self.profiler.mark('draw')
+            self.sb.queue_score(queue)
+            rects += queue.flush()
+            self.profiler.mark('score')
+        else:
+            self.sb.queue_score(queue)
+            rects = queue.flush()
 
         # Кнопка Play отображается в том случае, если игра неактивна
         # Чтобы кнопка не закрывалась другими элементами экрана, отображаем её после всех оствльных игровых элементов,
         # но перед переключение на новый экран.
         if not self.stats.game_active:
-            self.play_button.draw_button()
+            rects.append(self.play_button.draw_button())
 
-        #  Отображение последнего прорисованного экрана
-        pygame.display.flip()
+        if self.profiler.hud_visible:
+            rects.append(self.profiler.draw_hud())
+        self.profiler.mark('hud')
+        return rects
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Игра Alien Invasion")
+    parser.add_argument("--record", metavar="FILE",
+                        help="записать ввод по тикам для воспроизведения в replay.py")
+    parser.add_argument("--profile-csv", metavar="FILE",
+                        help="записывать время этапов каждого кадра в CSV")
+    parser.add_argument("--startup-report", action="store_true",
+                        help="вывести время этапов запуска до первого кадра")
+    parser.add_argument("--display-scaling", choices=SCALING_MODES, default="native",
+                        help="native - поле размером с монитор, scaled и blit - поле "
+                             "из Settings с масштабированием до размера монитора")
+    parser.add_argument("--alloc-interval", type=int, default=0, metavar="FRAMES",
+                        help="отслеживать рост памяти снимками tracemalloc каждые FRAMES кадров")
+    args = parser.parse_args()
+
     #  Создание экземпляра и запуск игры
-    ai = AlienInvasion()
+    settings = Settings()
+    settings.record_path = args.record
+    settings.profile_csv = args.profile_csv
+    settings.startup_report = args.startup_report
+    settings.alloc_interval = args.alloc_interval
+    settings.display_scaling = args.display_scaling
+    ai = AlienInvasion(settings=settings)
     ai.run_game()
@@ -0,0 +1,190 @@
+"""Поиск роста памяти по кадрам с помощью tracemalloc.
+
+Каждые interval кадров делается снимок tracemalloc. Прирост памяти
+между снимками относится к строке кода игры, из которой был сделан
+вызов, выделивший память (даже если сама память выделена внутри pygame
+или стандартной библиотеки). Отдельно считаются блоки размера объекта
+pygame.Rect и pygame.Surface.
+
+Снимок видит только живые блоки, поэтому все числа - чистый прирост
+живых блоков между снимками, а не число выделений за кадр: объекты,
+созданные и освобожденные в одном кадре, в отчет не попадают. Блоки
+Rect и Surface определяются по размеру объекта, а не по типу.
+
+Запуск без аргументов выполняет длительный прогон в режиме headless
+и завершается с ошибкой, если после разогрева память растет быстрее
+порога:
+    python alloc_tracker.py --frames 6000 --threshold 16
+"""
+import argparse
+import os
+import sys
+import tracemalloc
+
+import pygame
+
+GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+# Память самого трекера (снимки, отчеты) в учет не входит.
+TRACKER_FILE = os.path.abspath(__file__)
+
+# Размеры блоков, которые занимают сами объекты Rect и Surface (без пикселов).
+RECT_SIZE = sys.getsizeof(pygame.Rect(0, 0, 0, 0))
+SURFACE_SIZE = sys.getsizeof(pygame.Surface((1, 1)))
+
+
+def attribute(snapshot):
+    """Сводит живые блоки снимка по строкам кода игры.
+
+    Возвращает словарь {(файл, строка): [байты, блоки, блоки размера Rect,
+    блоки размера Surface]}.
+    """
+    sites = {}
+    for trace in snapshot.traces:
+        site = None
+        # Ищется ближайший к месту выделения кадр из файлов игры
+        # (кадры стека идут от самого старого к самому новому).
+        for frame in reversed(trace.traceback):
+            if frame.filename.startswith(GAME_DIR) and frame.filename != TRACKER_FILE:
+                site = (frame.filename, frame.lineno)
+                break
+        if site is None:
+            continue
+        totals = sites.setdefault(site, [0, 0, 0, 0])
+        totals[0] += trace.size
+        totals[1] += 1
+        if trace.size == RECT_SIZE:
+            totals[2] += 1
+        elif trace.size == SURFACE_SIZE:
+            totals[3] += 1
+    return sites
+
+
+def diff_sites(before, after):
+    """Возвращает прирост по строкам кода, отсортированный по байтам"""
+    growth = []
+    for site in before.keys() | after.keys():
+        old = before.get(site, (0, 0, 0, 0))
+        new = after.get(site, (0, 0, 0, 0))
+        delta = [b - a for a, b in zip(old, new)]
+        if any(delta):
+            growth.append((site, delta))
+    growth.sort(key=lambda item: item[1][0], reverse=True)
+    return growth
+
+
+class AllocationTracker:
+    """Класс для снимков tracemalloc каждые interval кадров."""
+
+    def __init__(self, interval=300, depth=16):
+        """Инициализирует трекер; depth - глубина стека для поиска строки игры"""
+        self.interval = interval
+        self.depth = depth
+        self.frames = 0
+        self.records = []
+        self._sites = None
+        self._filters = [tracemalloc.Filter(True, os.path.join(GAME_DIR, '*'), all_frames=True)]
+
+    def start(self):
+        """Включает tracemalloc и делает первый снимок"""
+        tracemalloc.start(self.depth)
+        self.frames = 0
+        self.records = []
+        self._sites = self._take()
+
+    def _take(self):
+        """Делает снимок и сводит его по строкам кода игры"""
+        return attribute(tracemalloc.take_snapshot().filter_traces(self._filters))
+
+    def frame(self):
+        """Учитывает кадр; каждые interval кадров сравнивает память со снимком"""
+        self.frames += 1
+        if self.frames % self.interval:
+            return None
+        sites = self._take()
+        growth = diff_sites(self._sites, sites)
+        self._sites = sites
+        totals = [sum(delta[index] for _, delta in growth) for index in range(4)]
+        # Средний чистый прирост живых блоков за кадр интервала.
+        record = {
+            'frame': self.frames,
+            'net_bytes_per_frame': totals[0] / self.interval,
+            'net_blocks_per_frame': totals[1] / self.interval,
+            'net_rect_sized_blocks_per_frame': totals[2] / self.interval,
+            'net_surface_sized_blocks_per_frame': totals[3] / self.interval,
+            'top': growth[:10],
+        }
+        self.records.append(record)
+        return record
+
+    def stop(self):
+        """Выключает tracemalloc"""
+        tracemalloc.stop()
+
+    def report(self, records=None):
+        """Возвращает строки отчета о росте памяти по интервалам"""
+        lines = []
+        for record in records if records is not None else self.records:
+            lines.append(f"frame {record['frame']}: net live growth "
+                         f"{record['net_bytes_per_frame']:+.1f} B/frame, "
+                         f"{record['net_blocks_per_frame']:+.2f} blocks/frame "
+                         f"(Rect-sized {record['net_rect_sized_blocks_per_frame']:+.2f}, "
+                         f"Surface-sized {record['net_surface_sized_blocks_per_frame']:+.2f})")
+            for (filename, lineno), (size, count, _, _) in record['top'][:5]:
+                lines.append(f"    {os.path.relpath(filename, GAME_DIR)}:{lineno}: "
+                             f"{size:+d} B, {count:+d} live blocks")
+        return lines
+
+
+def soak(frames, warmup, interval, seed=0):
+    """Играет frames кадров в режиме headless и возвращает трекер.
+
+    Каждый кадр - тик симуляции и полная отрисовка. Агент двигается
+    и стреляет по простому расписанию, после поражения игра начинается заново.
+    """
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    from alien_invasion import AlienInvasion
+
+    ai = AlienInvasion(headless=True)
+    ai.step({'play'})
+    tracker = AllocationTracker(interval)
+    for number in range(warmup + frames):
+        if number == warmup:
+            tracker.start()
+        direction = 'left' if (number + seed) // 240 % 2 else 'right'
+        ai.step({direction, 'hold_fire'} if ai.stats.game_active else {'play'})
+        ai.screen.fill(ai.settings.bg_color)
+        ai.draw_frame()
+        if number >= warmup:
+            tracker.frame()
+    tracker.stop()
+    return tracker
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Длительный прогон Alien Invasion с поиском роста памяти")
+    parser.add_argument("--frames", type=int, default=6000,
+                        help="число замеряемых кадров")
+    parser.add_argument("--warmup", type=int, default=600,
+                        help="кадры до начала замера (кэши, пул снарядов)")
+    parser.add_argument("--interval", type=int, default=600,
+                        help="кадров между снимками tracemalloc")
+    parser.add_argument("--threshold", type=float, default=16.0,
+                        help="допустимый рост памяти в байтах на кадр")
+    args = parser.parse_args(argv)
+
+    tracker = soak(args.frames, args.warmup, args.interval)
+    for line in tracker.report():
+        print(line)
+
+    # Первый интервал включает заполнение кэшей, устоявшийся режим - остальные.
+    steady = tracker.records[1:] or tracker.records
+    rate = sum(record['net_bytes_per_frame'] for record in steady) / len(steady)
+    print(f"steady-state growth {rate:+.1f} B/frame (threshold {args.threshold} B/frame)")
+    if rate > args.threshold:
+        print("FAIL")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+import math
+
+import numpy as np
+
+from fleet import Fleet
+
+
+def _round(values):
+    """Округляет как pygame.Rect: половина округляется от нуля"""
+    return np.trunc(values + np.copysign(0.5, values))
+
+
+class ArrayFleet(Fleet):
+    """Флот, в котором координаты пришельцев хранятся в массивах NumPy.
+
+    Движение и снижение флота выполняются одной векторной операцией
+    только над массивами, а границы флота для проверки краев ведет базовый
+    Fleet. Спрайты пришельцев остаются в группе как представление для
+    столкновений и внешнего кода, но их координаты обновляются лениво:
+    sprites() (а значит, и перебор группы) сначала переносит координаты
+    из массивов во все спрайты, а проверки краев и столкновений через
+    сетку обновляют только тех пришельцев, которых читают. Отрисовка
+    берет позиции прямо из массивов.
+    """
+
+    def __init__(self, settings, capacity=64):
+        """Инициализирует пустые массивы координат заданной емкости"""
+        super().__init__(settings)
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.slot_sprites = [None] * capacity
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+        # Индексы живых слотов и их спрайты пересчитываются после изменения состава.
+        self._alive_slots = np.zeros(0, dtype=np.intp)
+        self._alive_sprites = []
+        self._membership_changed = False
+
+        # Координаты, которые изменились в массивах, но еще не перенесены в спрайты.
+        self._stale_x = False
+        self._stale_y = False
+
+    def _grow(self):
+        """Удваивает емкость массивов"""
+        old = len(self.x)
+        new = old * 2
+        self.x = np.concatenate((self.x, np.zeros(old)))
+        self.y = np.concatenate((self.y, np.zeros(old)))
+        self.alive = np.concatenate((self.alive, np.zeros(old, dtype=bool)))
+        self.slot_sprites.extend([None] * old)
+        self.free_slots.extend(range(new - 1, old - 1, -1))
+
+    def add_internal(self, sprite, layer=None):
+        """Занимает свободный слот и копирует в него позицию пришельца"""
+        super().add_internal(sprite, layer)
+        if not self.free_slots:
+            self._grow()
+        slot = self.free_slots.pop()
+        sprite.fleet_slot = slot
+        self.slot_sprites[slot] = sprite
+        self.x[slot] = sprite.x
+        self.y[slot] = sprite.rect.y
+        self.alive[slot] = True
+        self._membership_changed = True
+
+    def remove_internal(self, sprite):
+        """Освобождает слот убитого или удаленного пришельца"""
+        # Спрайт уходит из флота со своими текущими координатами.
+        self._refresh((sprite,))
+        super().remove_internal(sprite)
+        slot = sprite.fleet_slot
+        self.alive[slot] = False
+        self.slot_sprites[slot] = None
+        self.free_slots.append(slot)
+        self._membership_changed = True
+
+    def _refresh_alive(self):
+        """Пересчитывает индексы живых слотов после изменения состава флота"""
+        if self._membership_changed:
+            self._alive_slots = np.flatnonzero(self.alive)
+            self._alive_sprites = [self.slot_sprites[slot] for slot in self._alive_slots]
+            self._membership_changed = False
+        return self._alive_slots
+
+    def sync(self):
+        """Переносит изменившиеся координаты из массивов во все спрайты"""
+        if not (self._stale_x or self._stale_y):
+            return
+        slots = self._refresh_alive()
+        if self._stale_x:
+            xs = self.x[slots]
+            for alien, x, rect_x in zip(self._alive_sprites, xs.tolist(),
+                                        _round(xs).astype(int).tolist()):
+                alien.x = x
+                alien.rect.x = rect_x
+        if self._stale_y:
+            for alien, rect_y in zip(self._alive_sprites, self.y[slots].astype(int).tolist()):
+                alien.rect.y = rect_y
+        self._stale_x = False
+        self._stale_y = False
+
+    def sprites(self):
+        """Возвращает список пришельцев с координатами из массивов"""
+        self.sync()
+        return super().sprites()
+
+    def __len__(self):
+        """Возвращает число пришельцев; Group для этого вызывал бы sprites()"""
+        return len(self.spritedict)
+
+    def __bool__(self):
+        """Проверяет, есть ли во флоте пришельцы, без переноса координат"""
+        return bool(self.spritedict)
+
+    def _refresh(self, aliens):
+        """Переносит координаты из массивов в спрайты aliens"""
+        if not (self._stale_x or self._stale_y):
+            return
+        for alien in aliens:
+            slot = alien.fleet_slot
+            x = float(self.x[slot])
+            alien.x = x
+            alien.rect.x = int(x + math.copysign(0.5, x))
+            alien.rect.y = int(self.y[slot])
+
+    def _scan_extents(self):
+        """Находит границы флота по массивам"""
+        slots = self._refresh_alive()
+        width, height = self._alive_sprites[0].rect.size
+        lefts = _round(self.x[slots])
+        return int(lefts.min()), int(lefts.max()) + width, int(self.y[slots].max()) + height
+
+    def queue_draw(self, queue):
+        """Добавляет пришельцев в очередь отрисовки по позициям из массивов"""
+        slots = self._refresh_alive()
+        if len(slots):
+            queue.add_positions(self._alive_sprites[0].image,
+                                _round(self.x[slots]).astype(int).tolist(),
+                                self.y[slots].astype(int).tolist())
+
+    def update(self, dt):
+        """Сдвигает весь флот по горизонтали одной векторной операцией"""
+        slots = self._refresh_alive()
+        self.x[slots] += self.settings.alien_speed * self.settings.fleet_direction * dt
+        self._stale_x = True
+
+    def place(self, xs, rect_xs, rect_ys):
+        """Расставляет пришельцев по позициям в порядке группы и копирует их в массивы"""
+        super().place(xs, rect_xs, rect_ys)
+        slots = np.fromiter((alien.fleet_slot for alien in self.sprites()), np.intp, len(self))
+        self.x[slots] = xs
+        self.y[slots] = rect_ys
+
+    def drop(self, distance):
+        """Опускает весь флот на distance пикселов"""
+        slots = self._refresh_alive()
+        self.y[slots] += distance
+        self._stale_y = True
+
@@ -0,0 +1,117 @@
+import threading
+
+import pygame
+
+# Изображения, которые можно читать с диска до создания окна.
+GAME_IMAGES = ('images/alien.bmp', 'images/ship.bmp')
+
+
+class AssetCache:
+    """Класс для однократной загрузки изображений и шрифтов игры.
+
+    Каждый файл читается с диска один раз, затем поверхность переводится
+    в пиксельный формат экрана, и все объекты получают одну и ту же копию.
+    Чтение можно начать заранее в фоновом потоке, пока создается окно.
+    """
+
+    def __init__(self):
+        """Инициализирует пустой кэш и счетчики обращений."""
+        self.images = {}
+        self.fonts = {}
+        self.masks = {}
+
+        # Изображения, прочитанные фоновым потоком, но еще не переведенные в формат экрана.
+        self.preloaded = {}
+        self._loader = None
+
+        # Счетчики позволяют проверить, что смена уровня не обращается к диску.
+        self.load_count = 0
+        self.hit_count = 0
+
+    def preload(self, paths):
+        """Начинает чтение файлов paths в фоновом потоке."""
+        paths = [path for path in paths if path not in self.images]
+        if self._loader is not None or not paths:
+            return
+        self._loader = threading.Thread(target=self._read_files, args=(paths,), daemon=True)
+        self._loader.start()
+
+    def _read_files(self, paths):
+        """Читает файлы для preload(); ошибки проявятся при обычной загрузке."""
+        for path in paths:
+            try:
+                self.preloaded[path] = pygame.image.load(path)
+            except (pygame.error, OSError):
+                pass
+
+    def get_image(self, path):
+        """Возвращает общую поверхность для файла path."""
+        image = self.images.get(path)
+        if image is not None:
+            self.hit_count += 1
+            return image
+
+        if self._loader is not None:
+            self._loader.join()
+            self._loader = None
+        image = self.preloaded.pop(path, None)
+        if image is None:
+            image = pygame.image.load(path)
+        self.load_count += 1
+
+        # convert() возможен только после создания окна.
+        if pygame.display.get_surface() is not None:
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+
+        self.images[path] = image
+        return image
+
+    def get_mask(self, path):
+        """Возвращает общую маску непрозрачных пикселов изображения path.
+
+        У изображений игры нет прозрачности: фон залит цветом левого
+        верхнего пиксела, поэтому в маску попадают пикселы другого цвета.
+        """
+        mask = self.masks.get(path)
+        if mask is None:
+            image = self.get_image(path)
+            mask = pygame.mask.from_threshold(image, image.get_at((0, 0)), (1, 1, 1, 255))
+            mask.invert()
+            self.masks[path] = mask
+        return mask
+
+    def get_font(self, name, size):
+        """Возвращает общий шрифт name размера size.
+
+        Шрифт по умолчанию (name=None) создается напрямую, без SysFont:
+        SysFont при первом вызове опрашивает все шрифты системы.
+        """
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if name is None:
+                font = pygame.font.Font(None, size)
+            else:
+                font = pygame.font.SysFont(name, size)
+            self.fonts[key] = font
+        return font
+
+    def clear(self):
+        """Очищает кэш и сбрасывает счетчики."""
+        self.images.clear()
+        self.fonts.clear()
+        self.masks.clear()
+        self.preloaded.clear()
+        self.reset_counters()
+
+    def reset_counters(self):
+        """Обнуляет счетчики загрузок и попаданий."""
+        self.load_count = 0
+        self.hit_count = 0
+
+
+# Общий кэш, которым пользуются Alien, Ship, панель счета и кнопка.
+cache = AssetCache()
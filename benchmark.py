@@ -0,0 +1,256 @@
+"""Замер производительности горячих участков кадра в режиме headless.
+
+Каждый этап кадра (_create_fleet, _update_bullets,
+_check_bullet_alien_collisions, _update_aliens и _update_screen)
+замеряется отдельно для разных разрешений экрана, размеров флота
+и значений bullets_allowed.
+
+Примеры запуска:
+    python benchmark.py --output bench.json
+    python benchmark.py --output new.json --compare bench.json
+"""
+import argparse
+import itertools
+import json
+import platform
+import random
+import sys
+import time
+
+import pygame
+
+from alien import Alien
+from alien_invasion import AlienInvasion
+from settings import Settings
+
+RESOLUTIONS = [(1200, 800), (1920, 1080), (3840, 2160)]
+# None означает стандартную сетку флота, которую строит _create_fleet.
+FLEET_SIZES = [None, 1000, 4000]
+BULLET_COUNTS = [3, 50, 300]
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, percent):
+    """Возвращает перцентиль отсортированного списка (метод ближайшего ранга)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-percent * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def summarize(samples_ns):
+    """Переводит замеры в миллисекунды и считает перцентили."""
+    values = sorted(ns / 1e6 for ns in samples_ns)
+    summary = {f"p{p}": percentile(values, p) for p in PERCENTILES}
+    summary["mean"] = sum(values) / len(values) if values else 0.0
+    summary["max"] = values[-1] if values else 0.0
+    return summary
+
+
+def scenario_key(scenario):
+    """Строит ключ сценария, по которому сравниваются результаты."""
+    width, height = scenario["resolution"]
+    fleet = scenario["fleet"] if scenario["fleet"] is not None else "default"
+    return f"{width}x{height}/fleet={fleet}/bullets={scenario['bullets']}"
+
+
+class Benchmark:
+    """Прогон одного сценария: разрешение, размер флота и число снарядов."""
+
+    def __init__(self, resolution, fleet, bullets, frames, seed=0, fleet_engine='sprites',
+                 render_mode='full', collision_mask=False):
+        """Создает игру в режиме headless с нужными настройками."""
+        settings = Settings()
+        settings.screen_width, settings.screen_height = resolution
+        settings.bullets_allowed = bullets
+        settings.fleet_engine = fleet_engine
+        settings.render_mode = render_mode
+        settings.collision_mask = collision_mask
+
+        self.fleet = fleet
+        self.bullets = bullets
+        self.frames = frames
+        self.random = random.Random(seed)
+
+        self.ai = AlienInvasion(settings=settings, headless=True)
+        self.ai.stats.game_active = True
+        self.dt = 1 / settings.tick_rate
+        self.fleet_size = self._reset_fleet()
+        self.mask_tests = 0
+
+    def _reset_fleet(self):
+        """Строит флот заданного размера и возвращает число пришельцев."""
+        ai = self.ai
+        ai.aliens.empty()
+        ai.settings.fleet_direction = 1
+        if self.fleet is None:
+            ai._create_fleet()
+            return len(ai.aliens)
+
+        # Плотная сетка с шагом в одного пришельца и отступом в две ширины
+        # от краев. Если пришельцы не помещаются, сетка повторяется поверх себя.
+        alien_width, alien_height = Alien(ai).rect.size
+        width, height = ai.settings.screen_width, ai.settings.screen_height
+        columns = max(1, (width - 4 * alien_width) // alien_width)
+        rows = max(1, (height - 3 * alien_height - ai.ship.rect.height) // alien_height)
+        for number in range(self.fleet):
+            alien = Alien(ai)
+            alien.x = 2 * alien_width + (number % columns) * alien_width
+            alien.rect.x = alien.x
+            alien.rect.y = alien_height + (number // columns % rows) * alien_height
+            ai.aliens.add(alien)
+        return self.fleet
+
+    def _refill(self):
+        """Восстанавливает флот и снаряды перед замером кадра (вне замера)."""
+        ai = self.ai
+        if len(ai.aliens) < self.fleet_size * 0.9:
+            self._reset_fleet()
+        ai.ship.center_ship()
+
+        width, height = ai.settings.screen_width, ai.settings.screen_height
+        while len(ai.bullets) < self.bullets:
+            ai.bullets.fire((self.random.randrange(width), self.random.randrange(height)))
+
+    def _time_stage(self, stage, setup=None):
+        """Замеряет stage() frames раз и возвращает список времен в нс."""
+        samples = []
+        for _ in range(self.frames):
+            if setup is not None:
+                setup()
+            start = time.perf_counter_ns()
+            stage()
+            samples.append(time.perf_counter_ns() - start)
+        return samples
+
+    def _create_fleet(self):
+        """Этап построения стандартного флота."""
+        self.ai.aliens.empty()
+        self.ai._create_fleet()
+
+    def run(self):
+        """Замеряет все этапы и возвращает сводку по ним."""
+        ai = self.ai
+        stages = {}
+        if self.fleet is None:
+            stages["create_fleet"] = self._time_stage(self._create_fleet)
+            self._reset_fleet()
+
+        stages["update_bullets"] = self._time_stage(
+            lambda: ai._update_bullets(self.dt), self._refill)
+        mask_tests = ai.aliens.mask_tests
+        stages["check_bullet_alien_collisions"] = self._time_stage(
+            ai._check_bullet_alien_collisions, self._refill)
+        self.mask_tests = (ai.aliens.mask_tests - mask_tests) / self.frames
+        stages["update_aliens"] = self._time_stage(
+            lambda: ai._update_aliens(self.dt), self._refill)
+        stages["update_screen"] = self._time_stage(ai._update_screen, self._refill)
+
+        return {name: summarize(samples) for name, samples in stages.items()}
+
+
+def run_suite(resolutions, fleets, bullet_counts, frames, fleet_engine='sprites',
+              render_mode='full', collision_mask=False):
+    """Прогоняет все сочетания параметров и возвращает результаты."""
+    results = []
+    for resolution, fleet, bullets in itertools.product(resolutions, fleets, bullet_counts):
+        bench = Benchmark(resolution, fleet, bullets, frames, fleet_engine=fleet_engine,
+                          render_mode=render_mode, collision_mask=collision_mask)
+        scenario = {"resolution": list(resolution), "fleet": fleet, "bullets": bullets}
+        entry = {
+            "key": scenario_key(scenario),
+            "scenario": scenario,
+            "fleet_size": bench.fleet_size,
+            "stages": bench.run(),
+            "mask_tests_per_frame": bench.mask_tests,
+        }
+        results.append(entry)
+        print(f"{entry['key']}: " + ", ".join(
+            f"{name} p95={stats['p95']:.3f}ms" for name, stats in entry["stages"].items())
+            + (f", mask tests/frame={bench.mask_tests:.1f}" if collision_mask else ""))
+    return results
+
+
+def compare(old, new, threshold):
+    """Сравнивает два прогона и возвращает число регрессий по p95."""
+    old_results = {entry["key"]: entry for entry in old["results"]}
+    regressions = 0
+    for entry in new["results"]:
+        previous = old_results.get(entry["key"])
+        if previous is None:
+            continue
+        for stage, stats in entry["stages"].items():
+            before = previous["stages"].get(stage)
+            if before is None:
+                continue
+            ratio = stats["p95"] / before["p95"] if before["p95"] else 1.0
+            flag = ""
+            if ratio > 1 + threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(f"{entry['key']} {stage}: p50 {before['p50']:.3f} -> {stats['p50']:.3f} ms, "
+                  f"p95 {before['p95']:.3f} -> {stats['p95']:.3f} ms ({ratio:.2f}x){flag}")
+    return regressions
+
+
+def parse_resolution(value):
+    """Разбирает строку вида 1920x1080."""
+    width, height = value.lower().split("x")
+    return int(width), int(height)
+
+
+def parse_fleet(value):
+    """Разбирает размер флота; 'default' означает стандартную сетку."""
+    return None if value == "default" else int(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замер горячих участков кадра Alien Invasion")
+    parser.add_argument("--output", default="bench_output.json",
+                        help="файл для результатов в формате JSON")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="сравнить результаты с ранее сохраненным файлом")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="допустимый рост p95 при сравнении (доля, по умолчанию 0.10)")
+    parser.add_argument("--frames", type=int, default=100,
+                        help="число замеров каждого этапа")
+    parser.add_argument("--resolutions", nargs="+", type=parse_resolution,
+                        default=RESOLUTIONS)
+    parser.add_argument("--fleets", nargs="+", type=parse_fleet, default=FLEET_SIZES)
+    parser.add_argument("--bullets", nargs="+", type=int, default=BULLET_COUNTS)
+    parser.add_argument("--fleet-engine", choices=("sprites", "numpy"), default="sprites",
+                        help="способ хранения флота (Settings.fleet_engine)")
+    parser.add_argument("--render-mode", choices=("full", "dirty"), default="full",
+                        help="способ отрисовки кадра (Settings.render_mode)")
+    parser.add_argument("--collision-mask", action="store_true",
+                        help="точные столкновения по маскам (Settings.collision_mask)")
+    args = parser.parse_args(argv)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "fleet_engine": args.fleet_engine,
+            "render_mode": args.render_mode,
+            "collision_mask": args.collision_mask,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": run_suite(args.resolutions, args.fleets, args.bullets, args.frames,
+                             args.fleet_engine, args.render_mode, args.collision_mask),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
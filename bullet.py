@@ -3,13 +3,16 @@ from pygame.sprite import Sprite
 
 
 class Bullet(Sprite):
-    """Класс для управления снарядами, выпуценными кораблем"""
+    """Класс для управления снарядами, выпуценными кораблем
+
+    У снаряда из BulletPool вещественная координата y хранится в массиве
+    запаса, а атрибут y обновляется только при выстреле.
+    """
 
     def __init__(self, ai_game):
         super().__init__()
         self.screen = ai_game.screen
         self.settings = ai_game.settings
-        self.color = self.settings.bullet_color
 
         # Создание снаряда в позиции (0, 0) и назначение правильной позиции
         self.rect = pygame.Rect(
@@ -19,15 +22,3 @@ class Bullet(Sprite):
         # Позиция снаряда хранится в вещественном формате
         self.y = float(self.rect.y)
         self.x = float(self.rect.x)
-
-    def update(self):
-        """Перемещает снаряд вверх по экрану"""
-        # обновление позиции снаряда в вещественном формате
-        self.y -= self.settings.bullet_speed
-
-        # обновление позиции прямоугольника
-        self.rect.y = self.y
-
-    def draw_bullet(self):
-        """Вывод снаряда на экран"""
-        pygame.draw.rect(self.screen, self.color, self.rect)
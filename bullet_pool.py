@@ -0,0 +1,131 @@
+from array import array
+
+import pygame
+from pygame.sprite import Group
+
+from bullet import Bullet
+
+
+class BulletPool(Group):
+    """Группа снарядов, которые создаются заранее и используются повторно.
+
+    Активные снаряды лежат плотным списком, их вертикальные координаты
+    хранятся в массиве того же порядка. Снаряд, покинувший группу (вылетел
+    за экран или попал в пришельца), удаляется перестановкой последнего
+    на его место и возвращается в запас, поэтому стрельба не создает
+    новых объектов, а отсечение не копирует группу.
+    """
+
+    def __init__(self, ai_game, capacity):
+        """Создает запас из capacity снарядов"""
+        super().__init__()
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+
+        self.active = []
+        self.y = array('d')
+        # Снаряд - сплошной прямоугольник, его маска заполнена целиком и общая для всех.
+        self.mask = pygame.mask.Mask((self.settings.bullet_width, self.settings.bullet_height),
+                                     fill=True)
+        self.free = [self._new_bullet() for _ in range(capacity)]
+
+        # Все снаряды одинаковы, поэтому рисуются одной заранее залитой поверхностью.
+        self.image = pygame.Surface((self.settings.bullet_width, self.settings.bullet_height))
+        self.image.fill(self.settings.bullet_color)
+        if pygame.display.get_surface() is not None:
+            self.image = self.image.convert()
+
+        # Статистика для подбора емкости запаса.
+        self.capacity = capacity
+        self.fired = 0
+        self.reused = 0
+        self.allocated = 0
+        self.peak = 0
+
+    def _new_bullet(self):
+        """Создает снаряд с общей маской"""
+        bullet = Bullet(self.ai_game)
+        bullet.mask = self.mask
+        return bullet
+
+    def _take(self):
+        """Берет снаряд из запаса; если запас пуст, создает новый"""
+        if self.free:
+            self.reused += 1
+            return self.free.pop()
+        self.allocated += 1
+        self.capacity += 1
+        return self._new_bullet()
+
+    def fire(self, midtop):
+        """Берет снаряд из запаса, ставит его в точку midtop и возвращает"""
+        bullet = self._take()
+        bullet.rect.midtop = midtop
+        bullet.x = float(bullet.rect.x)
+        bullet.y = float(bullet.rect.y)
+        self.fired += 1
+        self.add(bullet)
+        return bullet
+
+    def add_internal(self, sprite, layer=None):
+        """Добавляет снаряд в конец плотного списка"""
+        super().add_internal(sprite, layer)
+        sprite.pool_index = len(self.active)
+        self.active.append(sprite)
+        self.y.append(sprite.y)
+        self.peak = max(self.peak, len(self.active))
+
+    def remove_internal(self, sprite):
+        """Убирает снаряд перестановкой последнего и возвращает его в запас"""
+        super().remove_internal(sprite)
+        index = sprite.pool_index
+        last = self.active.pop()
+        last_y = self.y.pop()
+        if last is not sprite:
+            self.active[index] = last
+            self.y[index] = last_y
+            last.pool_index = index
+        self.free.append(sprite)
+
+    def update(self, dt):
+        """Сдвигает все снаряды вверх за dt секунд"""
+        distance = self.settings.bullet_speed * dt
+        y = self.y
+        for index, bullet in enumerate(self.active):
+            y[index] -= distance
+            bullet.rect.y = y[index]
+
+    def cull(self, screen_rect):
+        """Удаляет снаряды, вышедшие за край экрана"""
+        right = screen_rect.right
+        # Обход с конца: на место удаленного встает уже проверенный снаряд.
+        for index in range(len(self.active) - 1, -1, -1):
+            rect = self.active[index].rect
+            if rect.bottom <= 0 or rect.left >= right or rect.right <= 0:
+                self.remove(self.active[index])
+
+    def restore(self, states):
+        """Заменяет активные снаряды снарядами из запаса.
+
+        states - тройки (rect.x, rect.y, вещественный y) в порядке группы.
+        Запас учитывается так же, как при выстреле, но fired не меняется.
+        """
+        self.empty()
+        for rect_x, rect_y, y in states:
+            bullet = self._take()
+            bullet.rect.x = rect_x
+            bullet.rect.y = rect_y
+            bullet.y = y
+            self.add(bullet)
+
+    def stats(self):
+        """Возвращает заполненность запаса и счетчики повторного использования"""
+        return {
+            'capacity': self.capacity,
+            'active': len(self.active),
+            'free': len(self.free),
+            'peak': self.peak,
+            'fired': self.fired,
+            'reused': self.reused,
+            'allocated': self.allocated,
+        }
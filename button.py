@@ -1,4 +1,5 @@
 import pygame.font
+from assets import cache
 
 class Button:
     def __init__(self, ai_game, msg):
@@ -10,7 +11,7 @@ class Button:
         self.width, self.height = 200, 50
         self.button_color = (0, 255, 0)
         self.text_color = (255, 255, 255)
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = cache.get_font(None, 48)
 
         # Построение объекта rect кнопки и выравнивание по центру экрана.
         self.rect = pygame.Rect(0, 0, self.width, self.height)
@@ -26,6 +27,10 @@ class Button:
         self.msg_image_rect.center = self.rect.center
 
     def draw_button(self):
-        """Отображание пустой кнопки и вывод сообщения."""
+        """Отображание пустой кнопки и вывод сообщения.
+
+        Возвращает прямоугольник, занятый кнопкой.
+        """
         self.screen.fill(self.button_color, self.rect)
         self.screen.blit(self.msg_image, self.msg_image_rect)
+        return self.rect.union(self.msg_image_rect)
@@ -0,0 +1,105 @@
+import sys
+
+import pygame
+
+# Действия, которые считываются по состоянию клавиш в каждом тике.
+HELD_ACTIONS = ('left', 'right', 'up', 'down', 'fire')
+
+# События окна, после которых изображение нужно перерисовать целиком.
+EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWSHOWN,
+                 pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED, pygame.WINDOWSIZECHANGED)
+
+# Типы событий, которые игра обрабатывает; остальные отбрасываются SDL
+# и не попадают в очередь (например, движение мыши).
+ALLOWED_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN) + EXPOSE_EVENTS
+
+
+def build_keymap(bindings):
+    """Строит таблицу {код клавиши: действие} из {действие: [названия клавиш]}"""
+    keymap = {}
+    for action, key_names in bindings.items():
+        for key_name in key_names:
+            keymap[pygame.key.key_code(key_name)] = action
+    return keymap
+
+
+class Controls:
+    """Класс для обработки ввода игрока.
+
+    Клавиши назначаются действиям через Settings.key_bindings. Движение
+    и стрельба удержанием считываются через key.get_pressed() один раз
+    за тик, а нажатия, случившиеся между тиками (выстрел, кнопка Play),
+    копятся до ближайшего тика.
+    """
+
+    def __init__(self, ai_game):
+        """Строит таблицы клавиш и оставляет в очереди только нужные события"""
+        self.ai_game = ai_game
+        self.settings = ai_game.settings
+
+        self.keymap = build_keymap(self.settings.key_bindings)
+        # Удерживаемая клавиша выстрела дает действие 'hold_fire', которое
+        # ограничено интервалом fire_cooldown, а нажатие - 'fire' без ограничения.
+        self.held_keys = [(code, 'hold_fire' if action == 'fire' else action)
+                          for code, action in self.keymap.items() if action in HELD_ACTIONS]
+        if not self.settings.held_fire:
+            self.held_keys = [(code, action) for code, action in self.held_keys
+                              if action != 'hold_fire']
+
+        # Действия по нажатию клавиши, не связанные с тиками симуляции.
+        self.key_handlers = {
+            'fire': lambda: self.pending.add('fire'),
+            'quit': sys.exit,
+            'profiler': ai_game.profiler.toggle_hud,
+            'rewind': ai_game.rewind,
+        }
+        self.event_handlers = {
+            pygame.QUIT: lambda event: sys.exit(),
+            pygame.KEYDOWN: self._keydown,
+            pygame.MOUSEBUTTONDOWN: self._mouse_down,
+        }
+        for event_type in EXPOSE_EVENTS:
+            self.event_handlers[event_type] = self._exposed
+
+        # Выстрелы и нажатия кнопки Play между тиками, они выполняются в ближайшем тике.
+        self.pending = set()
+
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+
+    def handle_events(self):
+        """Обрабатывает накопившиеся события"""
+        for event in pygame.event.get():
+            handler = self.event_handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+
+    def _keydown(self, event):
+        """Выполняет действие, назначенное нажатой клавише"""
+        handler = self.key_handlers.get(self.keymap.get(event.key))
+        if handler is not None:
+            handler()
+
+    def _exposed(self, event):
+        """Перерисовывает кадр целиком после того, как окно было скрыто или изменено"""
+        if self.ai_game.dirty_renderer is not None:
+            self.ai_game.dirty_renderer.request_full_redraw()
+
+    def _mouse_down(self, event):
+        """Запускает новую игру при нажатии кнопки Play."""
+        ai_game = self.ai_game
+        # В режимах масштабирования координаты окна отличаются от координат кадра.
+        pos = ai_game.display.to_screen(event.pos)
+        button_clicked = ai_game.play_button.rect.collidepoint(pos)
+        if button_clicked and not ai_game.stats.game_active:
+            self.pending.add('play')
+
+    def sample(self):
+        """Возвращает действия очередного тика: удерживаемые клавиши и накопленные нажатия"""
+        actions = self.pending
+        self.pending = set()
+        pressed = pygame.key.get_pressed()
+        for code, action in self.held_keys:
+            if pressed[code]:
+                actions.add(action)
+        return actions
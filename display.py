@@ -0,0 +1,77 @@
+import pygame
+
+# Способы вывода кадра (Settings.display_scaling).
+SCALING_MODES = ('native', 'scaled', 'blit')
+
+
+class Display:
+    """Класс окна игры и поверхности, на которой рисуется кадр.
+
+    В режиме 'native' кадр рисуется прямо в окне на весь экран,
+    и размер игрового поля равен разрешению монитора. В режимах 'scaled'
+    и 'blit' игра всегда идет на поле screen_width x screen_height из
+    настроек: 'scaled' поручает масштабирование SDL (pygame.SCALED),
+    а 'blit' рисует кадр во внеэкранную поверхность и переносит ее
+    в окно одним масштабирующим блитом с сохранением пропорций.
+    """
+
+    def __init__(self, settings, headless=False):
+        """Открывает окно и создает поверхность кадра screen"""
+        self.settings = settings
+        # Часть окна, в которую масштабируется кадр в режиме 'blit'.
+        self.target = None
+
+        size = (settings.screen_width, settings.screen_height)
+        mode = settings.display_scaling
+        if mode not in SCALING_MODES:
+            raise ValueError(f"неизвестный способ вывода: {mode}")
+
+        if headless:
+            # Поверхность нужного размера в памяти вместо окна на весь экран.
+            self.window = pygame.display.set_mode(size)
+            self.screen = self.window
+        elif mode == 'native':
+            #  При создании экрана используются FULLSCREEN, вычисляющий размер окна
+            #  атрибуты screen_width и screen_height используются для обновления объекта settings
+            self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            self.screen = self.window
+            settings.screen_width, settings.screen_height = self.window.get_size()
+        else:
+            self.window = None
+            if mode == 'scaled':
+                try:
+                    self.window = pygame.display.set_mode(size, pygame.FULLSCREEN | pygame.SCALED)
+                    self.screen = self.window
+                except pygame.error:
+                    # SCALED требует рендерер SDL; без него кадр масштабируется блитом.
+                    self.window = None
+            if self.window is None:
+                self._open_blit(size)
+
+    def _open_blit(self, size):
+        """Открывает окно на весь экран и внеэкранную поверхность размера size"""
+        self.window = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        self.screen = pygame.Surface(size).convert()
+
+        # Кадр вписывается в окно с сохранением пропорций, поля остаются черными.
+        self.window.fill((0, 0, 0))
+        self.target = self.window.subsurface(self.screen.get_rect().fit(self.window.get_rect()))
+
+    def present(self, rects=None):
+        """Выводит кадр на экран; rects - изменившиеся области или None для всего кадра"""
+        if self.target is not None:
+            pygame.transform.scale(self.screen, self.target.get_size(), self.target)
+            pygame.display.flip()
+        elif rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+
+    def to_screen(self, pos):
+        """Переводит координаты окна (например, мыши) в координаты кадра"""
+        if self.target is None:
+            return pos
+        left, top = self.target.get_abs_offset()
+        width, height = self.target.get_size()
+        return ((pos[0] - left) * self.screen.get_width() // width,
+                (pos[1] - top) * self.screen.get_height() // height)
@@ -0,0 +1,240 @@
+"""Среда для обучения агентов на настоящей логике AlienInvasion.
+
+Интерфейс повторяет Gym: reset() возвращает наблюдение, step(action) -
+наблюдение, награду (прирост счета), признак конца игры и словарь info.
+Наблюдение - либо позиции корабля, снарядов и пришельцев, либо пикселы
+экрана (по желанию в оттенках серого и с уменьшением). VectorEnv
+запускает несколько сред в отдельных процессах, наблюдения которых
+лежат в общей памяти.
+
+Нужен пакет numpy.
+"""
+import multiprocessing
+import random
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pygame
+
+from fleet import fleet_layout
+
+# Дискретные действия агента.
+ACTIONS = (
+    frozenset(),
+    frozenset({'left'}),
+    frozenset({'right'}),
+    frozenset({'hold_fire'}),
+    frozenset({'left', 'hold_fire'}),
+    frozenset({'right', 'hold_fire'}),
+)
+
+GRAY_WEIGHTS = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+
+
+class AlienInvasionEnv:
+    """Одна игра в режиме headless с интерфейсом reset()/step()."""
+
+    def __init__(self, settings=None, frame_skip=4, observation='state',
+                 grayscale=False, downscale=1):
+        """Создает игру.
+
+        observation - 'state' (позиции объектов) или 'pixels' (экран);
+        frame_skip - сколько тиков симуляции выполняется за один step();
+        grayscale и downscale уменьшают пиксельное наблюдение.
+        """
+        # Импорт здесь, чтобы модуль можно было импортировать до выбора драйвера SDL.
+        from alien_invasion import AlienInvasion
+
+        self.ai = AlienInvasion(settings=settings, headless=True)
+        self.settings = self.ai.settings
+        self.frame_skip = frame_skip
+        self.observation = observation
+        self.grayscale = grayscale
+        self.downscale = downscale
+
+        width, height = self.settings.screen_width, self.settings.screen_height
+        if observation == 'pixels':
+            size = (len(range(0, width, downscale)), len(range(0, height, downscale)))
+            if grayscale:
+                self.observation_shape, self.observation_dtype = size, np.float32
+            else:
+                self.observation_shape, self.observation_dtype = size + (3,), np.uint8
+        elif observation == 'state':
+            # Строка на корабль, на каждый возможный снаряд и на каждого пришельца
+            # стандартного флота: (присутствует, x, y) в долях экрана.
+            alien_width, alien_height = self.ai.alien_prototype.rect.size
+            self.max_aliens = len(fleet_layout(width, height, alien_width, alien_height,
+                                               self.ai.ship.rect.height))
+            rows = 1 + self.settings.bullets_allowed + self.max_aliens
+            self.observation_shape, self.observation_dtype = (rows, 3), np.float32
+        else:
+            raise ValueError(f"неизвестный тип наблюдения: {observation}")
+
+        self.buffer = np.zeros(self.observation_shape, self.observation_dtype)
+        self.action_count = len(ACTIONS)
+
+    def reset(self, seed=None):
+        """Начинает новую игру и возвращает первое наблюдение"""
+        if seed is not None:
+            random.seed(seed)
+        self.ai._start_game()
+        return self._observe()
+
+    def step(self, action):
+        """Выполняет действие frame_skip тиков подряд.
+
+        action - номер в ACTIONS или набор названий действий.
+        Возвращает (наблюдение, награда, игра окончена, info).
+        """
+        actions = ACTIONS[action] if isinstance(action, (int, np.integer)) else action
+        stats = self.ai.stats
+        score = stats.score
+        for _ in range(self.frame_skip):
+            self.ai.step(actions)
+            if not stats.game_active:
+                break
+        info = {'score': stats.score, 'level': stats.level, 'ships_left': stats.ships_left}
+        return self._observe(), stats.score - score, not stats.game_active, info
+
+    def _observe(self):
+        """Записывает наблюдение в buffer и возвращает его.
+
+        Буфер переиспользуется: следующее наблюдение перезапишет предыдущее.
+        """
+        if self.observation == 'pixels':
+            self._observe_pixels()
+        else:
+            self._observe_state()
+        return self.buffer
+
+    def _observe_pixels(self):
+        """Рисует кадр и переносит пикселы экрана в buffer без промежуточных копий"""
+        screen = self.ai.screen
+        screen.fill(self.settings.bg_color)
+        self.ai.draw_frame()
+
+        # pixels3d - представление памяти экрана (ширина, высота, канал), а не копия.
+        # Пока оно существует, экран заблокирован, поэтому оно живет только здесь.
+        view = pygame.surfarray.pixels3d(screen)
+        step = self.downscale
+        pixels = view[::step, ::step]
+        if self.grayscale:
+            np.einsum('whc,c->wh', pixels, GRAY_WEIGHTS, out=self.buffer)
+        else:
+            self.buffer[...] = pixels
+        del pixels, view
+
+    def _observe_state(self):
+        """Записывает в buffer позиции корабля, снарядов и пришельцев"""
+        buffer = self.buffer
+        buffer[:] = 0
+        width, height = self.settings.screen_width, self.settings.screen_height
+        ai = self.ai
+
+        buffer[0] = (1.0, ai.ship.rect.centerx / width, ai.ship.rect.centery / height)
+        row = 1
+        for bullet in ai.bullets.active[:self.settings.bullets_allowed]:
+            buffer[row] = (1.0, bullet.rect.centerx / width, bullet.rect.centery / height)
+            row += 1
+
+        row = 1 + self.settings.bullets_allowed
+        for alien in ai.aliens.sprites()[:self.max_aliens]:
+            buffer[row] = (1.0, alien.rect.centerx / width, alien.rect.centery / height)
+            row += 1
+
+
+def _worker(conn, env_kwargs):
+    """Цикл процесса VectorEnv: выполняет команды reset, step и close"""
+    env = AlienInvasionEnv(**env_kwargs)
+    conn.send((env.observation_shape, np.dtype(env.observation_dtype).str))
+    index, memory_name, count = conn.recv()
+    memory = shared_memory.SharedMemory(name=memory_name)
+    # Общей памятью владеет VectorEnv; без этого трекер ресурсов удалил бы ее
+    # при выходе из процесса среды.
+    resource_tracker.unregister(memory._name, 'shared_memory')
+    observations = np.ndarray((count,) + env.observation_shape, env.observation_dtype,
+                              buffer=memory.buf)
+    # Среда пишет наблюдения прямо в свою строку общей памяти.
+    env.buffer = observations[index]
+
+    try:
+        while True:
+            command, argument = conn.recv()
+            if command == 'reset':
+                env.reset(argument)
+                conn.send(None)
+            elif command == 'step':
+                _, reward, done, info = env.step(argument)
+                if done:
+                    # Как в векторных средах Gym: после конца игры сразу начинается новая.
+                    info['final_score'] = info['score']
+                    env.reset()
+                conn.send((reward, done, info))
+            elif command == 'close':
+                break
+    finally:
+        del observations, env.buffer
+        memory.close()
+        conn.close()
+
+
+class VectorEnv:
+    """Несколько сред AlienInvasionEnv в отдельных процессах.
+
+    Наблюдения всех сред лежат в одном массиве в общей памяти: процессы
+    пишут в него напрямую, а reset() и step() возвращают этот массив
+    без копирования.
+    """
+
+    def __init__(self, count, **env_kwargs):
+        """Запускает count процессов; env_kwargs передаются в AlienInvasionEnv"""
+        self.count = count
+        self.connections = []
+        self.processes = []
+        for _ in range(count):
+            parent, child = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_worker, args=(child, env_kwargs), daemon=True)
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+        shapes = [conn.recv() for conn in self.connections]
+        shape, dtype = shapes[0]
+        self.memory = shared_memory.SharedMemory(
+            create=True, size=count * int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        self.observations = np.ndarray((count,) + tuple(shape), np.dtype(dtype),
+                                       buffer=self.memory.buf)
+        for index, conn in enumerate(self.connections):
+            conn.send((index, self.memory.name, count))
+
+    def reset(self, seed=None):
+        """Начинает новые игры во всех средах и возвращает наблюдения"""
+        for index, conn in enumerate(self.connections):
+            conn.send(('reset', None if seed is None else seed + index))
+        for conn in self.connections:
+            conn.recv()
+        return self.observations
+
+    def step(self, actions):
+        """Выполняет по действию в каждой среде.
+
+        Возвращает наблюдения, массивы наград и признаков конца игры и список info.
+        Закончившиеся игры сразу начинаются заново.
+        """
+        for conn, action in zip(self.connections, actions):
+            conn.send(('step', action))
+        results = [conn.recv() for conn in self.connections]
+        rewards = np.array([result[0] for result in results], dtype=np.float32)
+        dones = np.array([result[1] for result in results], dtype=bool)
+        return self.observations, rewards, dones, [result[2] for result in results]
+
+    def close(self):
+        """Останавливает процессы и освобождает общую память"""
+        for conn in self.connections:
+            conn.send(('close', None))
+        for process in self.processes:
+            process.join()
+        del self.observations
+        self.memory.close()
+        self.memory.unlink()
@@ -0,0 +1,250 @@
+from functools import lru_cache
+
+import pygame
+from pygame.sprite import Group
+
+from spatial_hash import SpatialHash
+
+# При малом числе пар "снаряд - пришелец" прямой перебор быстрее сетки.
+GRID_MIN_PAIRS = 256
+
+
+@lru_cache(maxsize=None)
+def fleet_layout(screen_width, screen_height, alien_width, alien_height, ship_height):
+    """Возвращает позиции (x, y) пришельцев стандартного флота по рядам сверху вниз.
+
+    Раскладка зависит только от размеров экрана, пришельца и корабля,
+    поэтому считается один раз на каждое их сочетание.
+    """
+    # Вычисляется доступное горизонтальное пространство и количество пришельцев, которые в нем поместятся.
+    # Интервал между соседними пришельцами равен ширине пришельца.
+    available_space_x = screen_width - (2 * alien_width)
+    number_aliens_x = available_space_x // (2 * alien_width)  # количество пришельцев в ряду
+
+    # Определяет количество рядов, помещающихся на экране.
+    available_space_y = screen_height - (3 * alien_height) - ship_height
+    number_rows = available_space_y // (2 * alien_height)
+
+    # Пришелец сдвигается вправо на одну ширину от левого края поля,
+    # 2 * alien_width - полное пространство выделенное на одного пришельца.
+    # Прибавляется одна высота пришельца, чтобы создать пустое место у вехнего края экрана,
+    # каждый новый ряд начинается на две высоты ниже последнего ряда.
+    return tuple((alien_width + 2 * alien_width * alien_number,
+                  alien_height + 2 * alien_height * row_number)
+                 for row_number in range(number_rows)
+                 for alien_number in range(number_aliens_x))
+
+
+class Fleet(Group):
+    """Группа пришельцев, которая умеет проверять и сдвигать весь флот целиком"""
+
+    def __init__(self, settings):
+        """Инициализирует пустой флот"""
+        super().__init__()
+        self.settings = settings
+
+        # Сетка для поиска столкновений перестраивается только после
+        # добавления пришельцев: флот движется как единое целое.
+        self.grid = None
+        self.version = 0
+        self._grid_version = -1
+
+        # Границы флота (левая, правая, нижняя) на момент, когда опорный
+        # пришелец стоял в точке _anchor_pos. Флот движется как единое целое,
+        # поэтому текущие границы получаются сдвигом на смещение опорного.
+        # None означает, что границы нужно пересчитать полным проходом.
+        self._extents = None
+        self._anchor = None
+        self._anchor_pos = (0, 0)
+
+        # Число проверок по маскам пикселов (для замеров стоимости точных столкновений).
+        self.mask_tests = 0
+
+    def add_internal(self, sprite, layer=None):
+        """Добавляет пришельца, расширяет границы и помечает сетку устаревшей"""
+        # Границы читаются до вставки: после нее extents() при включенной
+        # fleet_extents_check сравнил бы старые границы с флотом, где уже есть новый пришелец.
+        if self._extents is not None:
+            left, right, bottom = self.extents()
+        super().add_internal(sprite, layer)
+        self.version += 1
+        if self._extents is not None:
+            rect = sprite.rect
+            self._extents = (min(left, rect.left), max(right, rect.right),
+                             max(bottom, rect.bottom))
+            self._anchor_pos = self._anchor.rect.topleft
+
+    def remove_internal(self, sprite):
+        """Удаляет пришельца из группы, из сетки столкновений и из границ"""
+        if self._extents is not None:
+            left, right, bottom = self.extents()
+            rect = sprite.rect
+            if (sprite is self._anchor or rect.left == left or rect.right == right
+                    or rect.bottom == bottom):
+                self._extents = None
+                self._anchor = None
+        super().remove_internal(sprite)
+        if self.grid is not None:
+            self.grid.remove(sprite)
+
+    def _refresh(self, aliens):
+        """Обновляет rect пришельцев aliens перед чтением.
+
+        У Fleet координаты хранятся в самих спрайтах, поэтому обновлять
+        нечего; ArrayFleet переносит сюда координаты из своих массивов.
+        """
+
+    def _scan_extents(self):
+        """Находит границы флота полным проходом по пришельцам"""
+        rects = [alien.rect for alien in self.sprites()]
+        return (min(rect.left for rect in rects), max(rect.right for rect in rects),
+                max(rect.bottom for rect in rects))
+
+    def extents(self):
+        """Возвращает левую, правую и нижнюю границы флота.
+
+        Полный проход нужен только после удаления крайнего пришельца;
+        в остальных кадрах границы сдвигаются вместе с флотом.
+        """
+        if self._extents is None:
+            self._extents = self._scan_extents()
+            # Опорным берется любой пришелец; список спрайтов для этого не нужен.
+            self._anchor = next(iter(self.spritedict))
+            self._refresh((self._anchor,))
+            self._anchor_pos = self._anchor.rect.topleft
+        else:
+            self._refresh((self._anchor,))
+
+        left, right, bottom = self._extents
+        anchor_x, anchor_y = self._anchor_pos
+        dx = self._anchor.rect.x - anchor_x
+        dy = self._anchor.rect.y - anchor_y
+        extents = left + dx, right + dx, bottom + dy
+
+        if self.settings.fleet_extents_check and extents != self._scan_extents():
+            raise AssertionError(
+                f"границы флота {extents} не совпадают с полным проходом {self._scan_extents()}")
+        return extents
+
+    def check_edges(self, screen_rect):
+        """Возвращает True, если хотя бы один пришелец находится у края экрана"""
+        if not self:
+            return False
+        left, right, _ = self.extents()
+        return right >= screen_rect.right or left <= 0
+
+    def drop(self, distance):
+        """Опускает весь флот на distance пикселов"""
+        for alien in self.sprites():
+            alien.rect.y += distance
+
+    def queue_draw(self, queue):
+        """Добавляет пришельцев в очередь отрисовки"""
+        queue.add_sprites(self)
+
+    def place(self, xs, rect_xs, rect_ys):
+        """Расставляет пришельцев по позициям в порядке группы.
+
+        Пришельцы сдвигаются по отдельности, поэтому границы флота
+        и сетка столкновений пересчитываются заново.
+        """
+        for alien, x, rect_x, rect_y in zip(self.sprites(), xs, rect_xs, rect_ys):
+            alien.x = x
+            alien.rect.x = rect_x
+            alien.rect.y = rect_y
+        self._extents = None
+        self._anchor = None
+        self.version += 1
+
+    def reached_bottom(self, bottom):
+        """Возвращает True, если хотя бы один пришелец добрался до нижнего края"""
+        if not self:
+            return False
+        return self.extents()[2] >= bottom
+
+    def _current_grid(self):
+        """Возвращает сетку столкновений, перестраивая ее при изменении состава"""
+        if self._grid_version != self.version:
+            alien_width, alien_height = next(iter(self.spritedict)).rect.size
+            self.grid = SpatialHash(alien_width, alien_height)
+            self.grid.build(self.sprites())
+            self._grid_version = self.version
+        # Сдвиг сетки считается по первому разложенному в нее пришельцу.
+        for alien in self.grid.built_rects:
+            self._refresh((alien,))
+            break
+        return self.grid
+
+    def _pixel_hit(self, sprite, alien):
+        """Проверяет по маскам пару, прямоугольники которой уже пересеклись"""
+        self.mask_tests += 1
+        offset = (alien.rect.x - sprite.rect.x, alien.rect.y - sprite.rect.y)
+        return sprite.mask.overlap(alien.mask, offset) is not None
+
+    def collide_bullets(self, bullets):
+        """Уничтожает столкнувшиеся снаряды и пришельцев.
+
+        Результат совпадает с pygame.sprite.groupcollide(bullets, self, True, True):
+        словарь {снаряд: [пришельцы]} с тем же порядком и теми же удалениями.
+        При settings.collision_mask пары с пересекшимися прямоугольниками
+        дополнительно проверяются по маскам.
+        """
+        # Пустому флоту не нужны ни перебор, ни сетка (ее не по чему строить).
+        if not self:
+            return {}
+        mask = self.settings.collision_mask
+        if (not self.settings.collision_grid
+                or len(bullets) * len(self) < GRID_MIN_PAIRS):
+            if not mask:
+                return pygame.sprite.groupcollide(bullets, self, True, True)
+            # Пары по прямоугольникам ищет pygame, маски проверяются только для них.
+            candidates = pygame.sprite.groupcollide(bullets, self, False, False).items()
+        else:
+            grid = self._current_grid()
+            offset = grid.offset()
+            # Сетка опрашивается по ходу обхода, уже убитых пришельцев в ней нет.
+            candidates = ((bullet, grid.query(bullet.rect, offset)) for bullet in bullets.sprites())
+
+        crashed = {}
+        for bullet, aliens in candidates:
+            self._refresh(aliens)
+            rect = bullet.rect
+            if mask:
+                # Пришелец мог быть уничтожен предыдущим снарядом.
+                hits = [alien for alien in aliens
+                        if rect.colliderect(alien.rect) and self.has_internal(alien)
+                        and self._pixel_hit(bullet, alien)]
+            else:
+                hits = [alien for alien in aliens if rect.colliderect(alien.rect)]
+            if hits:
+                for alien in hits:
+                    alien.kill()
+                crashed[bullet] = hits
+                bullet.kill()
+        return crashed
+
+    def collide_sprite(self, sprite):
+        """Возвращает первого пришельца, столкнувшегося со sprite, или None.
+
+        Аналог pygame.sprite.spritecollideany(sprite, self); при
+        settings.collision_mask найденные пары проверяются по маскам.
+        """
+        if not self:
+            return None
+        mask = self.settings.collision_mask
+        if not self.settings.collision_grid or len(self) < GRID_MIN_PAIRS:
+            if not mask:
+                return pygame.sprite.spritecollideany(sprite, self)
+            candidates = pygame.sprite.spritecollide(sprite, self, False)
+        else:
+            rect = sprite.rect
+            nearby = self._current_grid().query(rect)
+            self._refresh(nearby)
+            candidates = [alien for alien in nearby if rect.colliderect(alien.rect)]
+            if not mask:
+                return candidates[0] if candidates else None
+
+        for alien in candidates:
+            if self._pixel_hit(sprite, alien):
+                return alien
+        return None
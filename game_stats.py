@@ -1,3 +1,10 @@
+# Состояния игры.
+MENU = 'menu'              # до первой игры, видна кнопка Play
+PLAYING = 'playing'        # идет игра
+RESPAWNING = 'respawning'  # пауза после потери корабля
+GAME_OVER = 'game_over'    # корабли закончились, видна кнопка Play
+
+
 class GameStats:
     """Отслеживание статистики для игры Alien Invasion"""
 
@@ -6,12 +13,23 @@ class GameStats:
         self.settings = ai_game.settings
         self.reset_stats()
 
-        # Игра Alien Invasion запускается в активном состоянии.
-        self.game_active = False
+        # Игра Alien Invasion запускается в меню.
+        self.state = MENU
+        # Сколько секунд симуляции осталось до конца паузы после потери корабля.
+        self.respawn_timer = 0.0
 
         # Рекорд не должен сбрасываться.
         self.high_score = 0
 
+    @property
+    def game_active(self):
+        """True, пока идет игра (в том числе пауза после потери корабля)"""
+        return self.state in (PLAYING, RESPAWNING)
+
+    @game_active.setter
+    def game_active(self, active):
+        self.state = PLAYING if active else GAME_OVER
+
     def reset_stats(self):
         """Инициализирует статистику, изменяющуюся в ходе игры"""
         self.ships_left = self.settings.ship_limit
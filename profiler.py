@@ -0,0 +1,137 @@
+import csv
+import time
+from collections import deque
+
+import pygame
+
+from assets import cache
+from text_renderer import TextRenderer
+
+# Этапы кадра в порядке выполнения. Время между двумя вызовами mark()
+# относится к этапу, названному во втором вызове.
+STAGES = ('wait', 'events', 'ship', 'bullets', 'aliens', 'draw', 'score', 'hud', 'flip')
+
+# Символы значений панели; названия этапов рисуются шрифтом один раз.
+HUD_CHARSET = "0123456789."
+
+
+class FrameProfiler:
+    """Класс для замера времени этапов каждого кадра.
+
+    Пока профилировщик выключен, mark() сразу возвращается, поэтому
+    вызовы можно оставлять в игровом цикле. Включенный профилировщик
+    хранит последние кадры в кольцевом буфере, рисует поверх экрана
+    панель с временем этапов и графиком кадров и может построчно
+    писать кадры в CSV.
+    """
+
+    def __init__(self, ai_game, history=120):
+        """Инициализирует профилировщик; включен, если задан profile_csv"""
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+
+        self.enabled = False
+        self.hud_visible = False
+        self.frames = deque(maxlen=history)
+        self.frame_number = 0
+        self.current = dict.fromkeys(STAGES, 0)
+        self._last = 0
+
+        self.csv_file = None
+        self.csv_writer = None
+        if self.settings.profile_csv:
+            self.csv_file = open(self.settings.profile_csv, "w", newline="")
+            self.csv_writer = csv.writer(self.csv_file)
+            self.csv_writer.writerow(['frame', 'total_ns'] + [f'{stage}_ns' for stage in STAGES])
+            self.enabled = True
+
+        # Панель рисуется в левом нижнем углу, над ней график кадров.
+        self.text_color = (0, 0, 0)
+        self.hud_bg_color = (255, 255, 200)
+        self.font = cache.get_font(None, 20)
+        self.text = TextRenderer(self.font, self.text_color, self.hud_bg_color,
+                                 charset=HUD_CHARSET, max_cached=len(STAGES) + 1)
+        self.labels = {label: self.font.render(label, True, self.text_color, self.hud_bg_color)
+                       for label in ('frame',) + STAGES}
+        self.value_x = max(label.get_width() for label in self.labels.values()) + 10
+        self.line_height = self.font.get_linesize()
+        self.graph_height = 60
+        self.hud_rect = pygame.Rect(0, 0, 180, self.graph_height + self.line_height * (len(STAGES) + 2))
+        self.hud_rect.bottomleft = self.screen.get_rect().bottomleft
+
+    def toggle_hud(self):
+        """Показывает или прячет панель; при показе включает замеры"""
+        self.hud_visible = not self.hud_visible
+        if self.hud_visible:
+            self.enabled = True
+        elif self.csv_writer is None:
+            self.enabled = False
+
+    def begin_frame(self):
+        """Начинает замер нового кадра"""
+        if not self.enabled:
+            return
+        for stage in STAGES:
+            self.current[stage] = 0
+        self._last = time.perf_counter_ns()
+
+    def mark(self, stage):
+        """Относит время с предыдущей отметки к этапу stage"""
+        if not self.enabled:
+            return
+        now = time.perf_counter_ns()
+        self.current[stage] += now - self._last
+        self._last = now
+
+    def end_frame(self):
+        """Сохраняет замеры кадра в буфер и в CSV"""
+        if not self.enabled:
+            return
+        times = tuple(self.current[stage] for stage in STAGES)
+        total = sum(times)
+        self.frames.append((total, times))
+        self.frame_number += 1
+        if self.csv_writer is not None:
+            self.csv_writer.writerow((self.frame_number, total) + times)
+
+    def close(self):
+        """Закрывает файл CSV"""
+        if self.csv_file is not None:
+            self.csv_file.close()
+            self.csv_file = None
+            self.csv_writer = None
+
+    def draw_hud(self):
+        """Рисует панель со средним временем этапов и графиком кадров.
+
+        Возвращает прямоугольник, занятый панелью.
+        """
+        self.screen.fill(self.hud_bg_color, self.hud_rect)
+        if not self.frames:
+            return self.hud_rect
+
+        count = len(self.frames)
+        totals = [0] * len(STAGES)
+        for _, times in self.frames:
+            for index, value in enumerate(times):
+                totals[index] += value
+
+        x = self.hud_rect.x + 5
+        y = self.hud_rect.y + self.graph_height + 5
+        frame_ms = sum(totals) / count / 1e6
+        self.screen.blit(self.labels['frame'], (x, y))
+        self.screen.blit(self.text.render(f"{frame_ms:.2f}"), (x + self.value_x, y))
+        for stage, total in zip(STAGES, totals):
+            y += self.line_height
+            self.screen.blit(self.labels[stage], (x, y))
+            self.screen.blit(self.text.render(f"{total / count / 1e6:.2f}"), (x + self.value_x, y))
+
+        # График: столбец на кадр, высота графика соответствует двум кадрам при fps_limit.
+        scale = self.graph_height / (2e9 / self.settings.fps_limit)
+        bottom = self.hud_rect.y + self.graph_height
+        left = self.hud_rect.right - count
+        for offset, (total, _) in enumerate(self.frames):
+            height = min(self.graph_height, int(total * scale))
+            pygame.draw.line(self.screen, self.text_color,
+                             (left + offset, bottom), (left + offset, bottom - height))
+        return self.hud_rect
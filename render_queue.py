@@ -0,0 +1,82 @@
+import pygame
+
+
+class SpriteAtlas:
+    """Общая поверхность, в которой лежат изображения всех спрайтов игры.
+
+    Корабль, пришелец и снаряд копируются в атлас один раз, после чего
+    любой из них рисуется блитом области атласа.
+    """
+
+    def __init__(self, images):
+        """Раскладывает изображения images в один ряд"""
+        width = sum(image.get_width() for image in images)
+        height = max(image.get_height() for image in images)
+        alpha = any(image.get_flags() & pygame.SRCALPHA for image in images)
+
+        self.surface = pygame.Surface((width, height), pygame.SRCALPHA if alpha else 0)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha() if alpha else self.surface.convert()
+
+        self.areas = {}
+        x = 0
+        for image in images:
+            area = pygame.Rect(x, 0, image.get_width(), image.get_height())
+            self.surface.blit(image, area)
+            self.areas[image] = area
+            x += area.width
+
+
+class RenderQueue:
+    """Очередь команд отрисовки кадра.
+
+    Команды копятся в списке и выводятся одним вызовом Surface.blits().
+    Изображения из атласа рисуются его областью, остальные (например,
+    текст панели счета) - как есть.
+    """
+
+    def __init__(self, screen, atlas):
+        """Инициализирует пустую очередь для вывода на screen"""
+        self.screen = screen
+        self.atlas = atlas
+        self.commands = []
+
+    def add(self, image, rect, area=None):
+        """Добавляет одно изображение; area - выводимая часть image"""
+        atlas_area = self.atlas.areas.get(image)
+        if atlas_area is not None:
+            self.commands.append((self.atlas.surface, rect, atlas_area))
+        elif area is None:
+            self.commands.append((image, rect))
+        else:
+            self.commands.append((image, rect, area))
+
+    def add_many(self, image, rects):
+        """Добавляет одно и то же изображение во всех прямоугольниках rects"""
+        area = self.atlas.areas.get(image)
+        if area is None:
+            self.commands.extend([(image, rect) for rect in rects])
+        else:
+            surface = self.atlas.surface
+            self.commands.extend([(surface, rect, area) for rect in rects])
+
+    def add_positions(self, image, xs, ys):
+        """Добавляет одно и то же изображение в точках (xs[i], ys[i])"""
+        area = self.atlas.areas.get(image)
+        if area is None:
+            self.commands.extend([(image, (x, y)) for x, y in zip(xs, ys)])
+        else:
+            surface = self.atlas.surface
+            self.commands.extend([(surface, (x, y), area) for x, y in zip(xs, ys)])
+
+    def add_sprites(self, sprites):
+        """Добавляет спрайты; изображение берется у первого, у всех оно общее"""
+        sprites = list(sprites)
+        if sprites:
+            self.add_many(sprites[0].image, [sprite.rect for sprite in sprites])
+
+    def flush(self):
+        """Выводит все команды на экран и возвращает занятые прямоугольники"""
+        rects = self.screen.blits(self.commands)
+        self.commands = []
+        return rects
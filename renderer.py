@@ -0,0 +1,52 @@
+class DirtyRenderer:
+    """Отрисовка кадра с обновлением только изменившихся областей экрана.
+
+    Как и pygame.sprite.RenderUpdates, запоминает прямоугольники, занятые
+    кораблем, снарядами, пришельцами и панелью счета в прошлом кадре.
+    В новом кадре фоном закрашиваются только они, а на экран передаются
+    старые и новые прямоугольники через display.update(rects). Если
+    изменилась слишком большая часть экрана, выполняется обычный flip().
+    """
+
+    def __init__(self, ai_game):
+        """Инициализирует отрисовку; первый кадр рисуется целиком"""
+        self.ai_game = ai_game
+        self.screen = ai_game.screen
+        self.settings = ai_game.settings
+
+        self.previous_rects = []
+        self.full_redraw = True
+
+        # Статистика последнего кадра.
+        self.dirty_area = 0
+        self.last_full = True
+
+    def request_full_redraw(self):
+        """Заставляет следующий кадр перерисоваться целиком"""
+        self.full_redraw = True
+
+    def update_screen(self):
+        """Обновляет изображение, перерисовывая только изменившиеся области"""
+        bg_color = self.settings.bg_color
+        full = self.full_redraw
+        if full:
+            self.screen.fill(bg_color)
+        else:
+            for rect in self.previous_rects:
+                self.screen.fill(bg_color, rect)
+
+        rects = self.ai_game.draw_frame()
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+
+        screen_rect = self.screen.get_rect()
+        self.dirty_area = sum(rect.width * rect.height for rect in dirty)
+        limit = screen_rect.width * screen_rect.height * self.settings.dirty_area_limit
+        if full or self.dirty_area > limit:
+            self.ai_game.display.present()
+            self.last_full = True
+        else:
+            self.ai_game.display.present(dirty)
+            self.last_full = False
+        self.full_redraw = False
+        self.ai_game.profiler.mark('flip')
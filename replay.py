@@ -0,0 +1,157 @@
+"""Запись ввода по тикам и воспроизведение записанной игры.
+
+Запись включается настройкой Settings.record_path: на каждый тик
+симуляции сохраняется один байт с флагами действий, а также зерно
+генератора случайных чисел и снимок настроек на момент старта.
+Воспроизведение прогоняет запись в режиме headless без отрисовки
+с максимальной скоростью и сверяет итоговые счет и уровень.
+
+Пример запуска:
+    python replay.py session.airp
+"""
+import argparse
+import json
+import random
+import struct
+import sys
+import time
+import zlib
+
+from settings import Settings
+
+MAGIC = b"AIRP"
+VERSION = 2
+
+# Порядок битов в байте тика.
+ACTIONS = ('left', 'right', 'up', 'down', 'fire', 'play', 'hold_fire')
+
+HEADER = struct.Struct("<4sHQI")
+TICKS = struct.Struct("<II")
+RESULT = struct.Struct("<qqq")
+
+
+def encode_actions(actions):
+    """Упаковывает набор действий в байт"""
+    bits = 0
+    for bit, action in enumerate(ACTIONS):
+        if action in actions:
+            bits |= 1 << bit
+    return bits
+
+
+def decode_actions(bits):
+    """Распаковывает байт тика в набор действий"""
+    return {action for bit, action in enumerate(ACTIONS) if bits & (1 << bit)}
+
+
+def snapshot_settings(settings):
+    """Возвращает настройки в виде словаря, пригодного для JSON"""
+    return dict(vars(settings))
+
+
+def restore_settings(snapshot):
+    """Создает Settings с сохраненными значениями.
+
+    Настройки вывода отчетов и записи (файлы, замеры) сбрасываются,
+    чтобы воспроизведение не перезаписало файлы исходной сессии.
+    """
+    settings = Settings()
+    for name, value in snapshot.items():
+        setattr(settings, name, tuple(value) if isinstance(value, list) else value)
+    settings.record_path = None
+    settings.profile_csv = None
+    settings.alloc_interval = 0
+    settings.startup_report = False
+    return settings
+
+
+class InputRecorder:
+    """Класс для записи действий игрока по тикам симуляции."""
+
+    def __init__(self, ai_game, seed=None):
+        """Запоминает настройки игры и задает зерно генератора случайных чисел"""
+        self.ai_game = ai_game
+        self.seed = seed if seed is not None else time.time_ns() & 0xFFFFFFFF
+        random.seed(self.seed)
+        self.settings = snapshot_settings(ai_game.settings)
+        self.ticks = bytearray()
+
+    def record(self, actions):
+        """Добавляет действия одного тика"""
+        self.ticks.append(encode_actions(actions))
+
+    def save(self, path):
+        """Записывает настройки, ввод и итог игры в файл path"""
+        stats = self.ai_game.stats
+        settings_data = json.dumps(self.settings).encode()
+        ticks_data = zlib.compress(bytes(self.ticks))
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.seed, len(settings_data)))
+            f.write(settings_data)
+            f.write(TICKS.pack(len(self.ticks), len(ticks_data)))
+            f.write(ticks_data)
+            f.write(RESULT.pack(stats.score, stats.level, stats.high_score))
+
+
+class Recording:
+    """Содержимое файла записи."""
+
+    def __init__(self, seed, settings, ticks, result):
+        """Сохраняет зерно, снимок настроек, байты тиков и итог (счет, уровень, рекорд)"""
+        self.seed = seed
+        self.settings = settings
+        self.ticks = ticks
+        self.result = result
+
+    @classmethod
+    def load(cls, path):
+        """Читает запись из файла path"""
+        with open(path, "rb") as f:
+            magic, version, seed, settings_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: неизвестный формат записи")
+            settings = json.loads(f.read(settings_size))
+            tick_count, ticks_size = TICKS.unpack(f.read(TICKS.size))
+            ticks = zlib.decompress(f.read(ticks_size))
+            result = RESULT.unpack(f.read(RESULT.size))
+        if len(ticks) != tick_count:
+            raise ValueError(f"{path}: запись повреждена")
+        return cls(seed, settings, ticks, result)
+
+
+def replay(recording):
+    """Прогоняет запись в режиме headless и возвращает игру после последнего тика"""
+    # Импорт здесь, чтобы alien_invasion мог импортировать этот модуль.
+    from alien_invasion import AlienInvasion
+
+    random.seed(recording.seed)
+    ai = AlienInvasion(settings=restore_settings(recording.settings), headless=True)
+    decoded = [decode_actions(bits) for bits in range(1 << len(ACTIONS))]
+    for bits in recording.ticks:
+        ai.step(decoded[bits])
+    return ai
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Воспроизведение записанной игры Alien Invasion")
+    parser.add_argument("recording", help="файл записи (Settings.record_path)")
+    args = parser.parse_args(argv)
+
+    recording = Recording.load(args.recording)
+    start = time.perf_counter()
+    ai = replay(recording)
+    elapsed = time.perf_counter() - start
+
+    result = (ai.stats.score, ai.stats.level, ai.stats.high_score)
+    ticks = len(recording.ticks)
+    print(f"{ticks} ticks in {elapsed:.2f} s ({ticks / elapsed if elapsed else 0:.0f} ticks/s)")
+    print(f"score {result[0]}, level {result[1]}, high score {result[2]}")
+    if result != recording.result:
+        print(f"MISMATCH: recorded score {recording.result[0]}, level {recording.result[1]}, "
+              f"high score {recording.result[2]}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
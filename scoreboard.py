@@ -1,6 +1,7 @@
-import pygame.font
 from pygame.sprite import Group
 from ship import Ship
+from assets import cache
+from text_renderer import TextRenderer
 
 class Scoreboard:
     """Класс для вывода игровой информации."""
@@ -13,7 +14,13 @@ class Scoreboard:
 
         # Настройки шрифта для вывода счета.
         self.text_color = (30, 30, 30)
-        self.font = pygame.font.SysFont(None, 48)
+        self.font = cache.get_font(None, 48)
+        # Цифры рисуются шрифтом один раз, числа собираются из готовых символов
+        # в свою поверхность для счета, рекорда и уровня.
+        self.text = TextRenderer(self.font, self.text_color, self.settings.bg_color)
+        self.score_image = None
+        self.high_score_image = None
+        self.level_image = None
 
         # Подготовка изображений счетов.
         self.prep_score()
@@ -24,10 +31,10 @@ class Scoreboard:
     def prep_score(self):
         """Преобразует текущий счет в графическое изображение"""
         score_str = str(self.stats.score)
-        self.score_image = self.font.render(score_str, True, self.text_color, self.settings.bg_color)
+        self.score_image, self.score_area = self.text.render_into(score_str, self.score_image)
 
         # Вывод счета в правой верхней части экрана.
-        self.score_rect = self.score_image.get_rect()
+        self.score_rect = self.score_area.copy()
         self.score_rect.right = self.screen_rect.right - 20
         self.score_rect.top = 20
 
@@ -35,22 +42,21 @@ class Scoreboard:
         """Преобразует рекордный счет в графическое изображение."""
         high_score = round(self.stats.high_score, -1)
         high_score_str = "{:,}".format(high_score)
-        self.high_score_image = self.font.render(high_score_str, True,
-                                                 self.text_color, self.settings.bg_color)
+        self.high_score_image, self.high_score_area = self.text.render_into(
+            high_score_str, self.high_score_image)
 
         # Рекорд выравнивается по центру верхней стороны.
-        self.high_score_rect = self.high_score_image.get_rect()
+        self.high_score_rect = self.high_score_area.copy()
         self.high_score_rect.center = self.screen_rect.center
         self.high_score_rect.top = self.score_rect.top
 
     def prep_level(self):
         """Преобразует уровень в графическое изоражение"""
         level_str = str(self.stats.level)
-        self.level_image = self.font.render(level_str, True,
-                                            self.text_color, self.settings.bg_color)
+        self.level_image, self.level_area = self.text.render_into(level_str, self.level_image)
 
         # Уровень выводится под текущим счетом.
-        self.level_rect = self.level_image.get_rect()
+        self.level_rect = self.level_area.copy()
         self.level_rect.right = self.score_rect.right
         self.level_rect.top = self.score_rect.bottom + 10
 
@@ -69,9 +75,9 @@ class Scoreboard:
             self.stats.high_score = self.stats.score
             self.prep_high_score()
 
-    def show_score(self):
-        """Выводит очки, уровень и количество кораблей на экран."""
-        self.screen.blit(self.score_image, self.score_rect)
-        self.screen.blit(self.high_score_image, self.high_score_rect)
-        self.screen.blit(self.level_image, self.level_rect)
-        self.ships.draw(self.screen)
+    def queue_score(self, queue):
+        """Добавляет очки, уровень и оставшиеся корабли в очередь отрисовки."""
+        queue.add(self.score_image, self.score_rect, self.score_area)
+        queue.add(self.high_score_image, self.high_score_rect, self.high_score_area)
+        queue.add(self.level_image, self.level_rect, self.level_area)
+        queue.add_sprites(self.ships)
@@ -7,21 +7,90 @@ class Settings:
         self.screen_width = 1200
         self.screen_height = 800
         self.bg_color = (230, 230, 230)
+        # Вывод кадра: 'native' - поле размером с монитор (screen_width и screen_height
+        # заменяются разрешением монитора), 'scaled' - поле screen_width x screen_height,
+        # которое масштабирует SDL, 'blit' - то же поле масштабируется одним блитом.
+        self.display_scaling = 'native'
 
-        # Настройки корабля
-        self.ship_speed = 1.5
+        # Способ отрисовки: 'full' - весь экран каждый кадр,
+        # 'dirty' - только изменившиеся прямоугольники.
+        self.render_mode = 'full'
+        # Доля площади экрана, после которой вместо частичного обновления
+        # выполняется полный flip().
+        self.dirty_area_limit = 0.5
+
+        # Параметры игрового цикла.
+        # Физика считается с постоянной частотой tick_rate (тиков в секунду),
+        # отрисовка ограничивается fps_limit кадрами в секунду.
+        self.tick_rate = 120
+        self.fps_limit = 60
+        # Максимальное время кадра, которое учитывается симуляцией (в секундах),
+        # чтобы после долгой паузы игра не пыталась наверстать все тики разом.
+        self.max_frame_time = 0.25
+        # Файл для записи ввода по тикам (см. replay.py); None - запись выключена.
+        self.record_path = None
+        # Файл CSV для времени этапов каждого кадра; None - замеры только по F3.
+        self.profile_csv = None
+        # Отчет о времени запуска (импорт, инициализация, окно, ресурсы, первый кадр)
+        # и допустимое время от запуска до первого кадра в секундах.
+        self.startup_report = False
+        self.startup_budget = 1.0
+        # Снимки tracemalloc каждые alloc_interval кадров с отчетом о росте памяти
+        # по строкам кода при выходе; 0 - выключено (см. alloc_tracker.py).
+        self.alloc_interval = 0
+        # Перемотка назад (см. snapshot.py): снимок состояния каждые rewind_interval тиков,
+        # последние снимки занимают не больше rewind_memory байт; 0 - перемотка выключена.
+        # При записи ввода (record_path) перемотка не работает: запись нельзя было бы воспроизвести.
+        self.rewind_interval = 30
+        self.rewind_memory = 1_000_000
+
+        # Настройки корабля (скорость в пикселах в секунду)
+        self.ship_speed = 300.0
         self.ship_limit = 3
+        # Пауза после потери корабля (в секундах симуляции) и период мигания корабля.
+        self.respawn_time = 0.5
+        self.respawn_blink = 0.1
 
-        # Параметры снаряда
-        self.bullet_speed = 1.5
+        # Параметры снаряда (скорость в пикселах в секунду)
+        self.bullet_speed = 300.0
         self.bullet_width = 3
         self.bullet_height = 15
         self.bullet_color = (60, 60, 60)
         self.bullets_allowed = 3
 
-        # Настройки пришельцев.
-        self.alien_speed = 1.0
+        # Поиск столкновений через сетку ячеек вместо перебора всех пар
+        # "снаряд - пришелец". Результат совпадает с groupcollide.
+        self.collision_grid = True
+        # Точные столкновения: пары, прямоугольники которых пересеклись,
+        # дополнительно проверяются по маскам пикселов (фон картинок не считается).
+        self.collision_mask = False
+
+        # Настройки пришельцев (скорость в пикселах в секунду).
+        self.alien_speed = 200.0
         self.fleet_drop_speed = 10
+        # Способ хранения флота: 'sprites' - каждый пришелец обновляется отдельно,
+        # 'numpy' - координаты флота хранятся в массивах NumPy (нужен пакет numpy).
+        self.fleet_engine = 'sprites'
+        # Отладка: сверять границы флота с полным проходом по пришельцам.
+        self.fleet_extents_check = False
+        # Сколько пришельцев нового флота появляется за один тик; 0 - весь флот сразу.
+        # Пока флот появляется, он не движется.
+        self.fleet_spawn_batch = 0
+
+        # Назначение клавиш: действие - список названий клавиш pygame.key.key_code.
+        self.key_bindings = {
+            'left': ['left'],
+            'right': ['right'],
+            'up': ['up'],
+            'down': ['down'],
+            'fire': ['space'],
+            'quit': ['q'],
+            'profiler': ['f3'],
+            'rewind': ['backspace'],
+        }
+        # Стрельба удержанием клавиши и минимальный интервал между выстрелами (в секундах).
+        self.held_fire = True
+        self.fire_cooldown = 0.25
 
         # Темп ускорения игры.
         self.speedup_scale = 3
@@ -1,5 +1,5 @@
-import pygame
 from pygame.sprite import Sprite
+from assets import cache
 
 class Ship(Sprite):
     """Класс управления кораблём"""
@@ -11,9 +11,10 @@ class Ship(Sprite):
         self.settings = ai_game.settings
         self.screen_rect = ai_game.screen.get_rect()
 
-        # Загружает изображение корабля и получает прямоугольник
-        self.image = pygame.image.load('images/ship.bmp')
+        # Берет изображение корабля из общего кэша и получает прямоугольник
+        self.image = cache.get_image('images/ship.bmp')
         self.rect = self.image.get_rect()
+        self.mask = cache.get_mask('images/ship.bmp')
 
         # Каждый новый корабль появляется у нижнего края экрана
         self.rect.midbottom = self.screen_rect.midbottom
@@ -30,26 +31,24 @@ class Ship(Sprite):
         self.moving_down = False
 
 
-    def update(self):
-        """Обновляет позицию корабля с учетом флагов"""
+    def update(self, dt):
+        """Обновляет позицию корабля с учетом флагов за dt секунд"""
+        distance = self.settings.ship_speed * dt
+
         # обновляется атрибут x, не rect
         if self.moving_right and self.rect.right < self.screen_rect.right:
-            self.x += self.settings.ship_speed
+            self.x += distance
         if self.moving_left and self.rect.left > 0:
-            self.x -= self.settings.ship_speed
+            self.x -= distance
         if self.moving_down and self.rect.bottom < self.screen_rect.bottom:
-            self.y += self.settings.ship_speed
+            self.y += distance
         if self.moving_up and self.rect.top > 0:
-            self.y -= self.settings.ship_speed
+            self.y -= distance
 
         # Обновление атрибута rect на основании self.x
         self.rect.x = self.x
         self.rect.y = self.y
 
-    def blitne(self):
-        """Рисует корабль в текущей позиции"""
-        self.screen.blit(self.image, self.rect)
-
     def center_ship(self):
         """Размещает корабль в центре нижней стороны."""
         self.rect.midbottom = self.screen_rect.midbottom
@@ -0,0 +1,190 @@
+"""Снимки состояния игры для сохранения, восстановления и перемотки назад.
+
+capture() упаковывает все, что меняется во время игры (статистику,
+изменяемые настройки, позиции корабля, снарядов и пришельцев, очередь
+появления флота), в компактную строку байтов. restore() переносит снимок
+в работающую игру: снаряды берутся из запаса BulletPool, а пришельцы
+текущего флота переиспользуются, новые только копируются с прототипа.
+
+Постоянные настройки в снимок не входят, поэтому снимок восстанавливается
+в игру с теми же настройками, например в другую игру в режиме headless
+для запуска нескольких продолжений из одной точки:
+    branch = AlienInvasion(settings=settings, headless=True)
+    restore(branch, capture(ai))
+
+SnapshotRing хранит последние снимки в пределах заданного объема памяти.
+"""
+import struct
+from array import array
+from collections import deque
+
+from game_stats import MENU, PLAYING, RESPAWNING, GAME_OVER
+
+MAGIC = b"AISS"
+VERSION = 2
+
+STATES = (MENU, PLAYING, RESPAWNING, GAME_OVER)
+
+# Размер поля, состояние игры и счетчики, изменяемые настройки,
+# корабль и число снарядов, пришельцев и позиций в очереди появления.
+HEADER = struct.Struct("<4sHII")
+STATE = struct.Struct("<BdiqiqdddbqiddiiIII")
+
+
+def capture(ai_game):
+    """Возвращает снимок состояния игры ai_game в виде bytes"""
+    stats = ai_game.stats
+    settings = ai_game.settings
+    ship = ai_game.ship
+
+    bullets = ai_game.bullets.sprites()
+    aliens = ai_game.aliens.sprites()
+    spawn = array('i')
+    for position in ai_game.spawn_queue:
+        spawn.extend(position)
+
+    # Вещественные y снарядов хранятся в массиве запаса.
+    pool_y = ai_game.bullets.y
+    return b"".join((
+        HEADER.pack(MAGIC, VERSION, settings.screen_width, settings.screen_height),
+        STATE.pack(STATES.index(stats.state), stats.respawn_timer, stats.ships_left,
+                   stats.score, stats.level, stats.high_score,
+                   settings.ship_speed_factor, settings.bullet_speed_factor,
+                   settings.alien_speed_factor, settings.fleet_direction,
+                   settings.alien_points, ai_game.fire_cooldown_ticks,
+                   ship.x, ship.y, ship.rect.x, ship.rect.y,
+                   len(bullets), len(aliens), len(spawn) // 2),
+        array('d', [pool_y[bullet.pool_index] for bullet in bullets]).tobytes(),
+        array('i', [bullet.rect.x for bullet in bullets]).tobytes(),
+        array('i', [bullet.rect.y for bullet in bullets]).tobytes(),
+        array('d', [alien.x for alien in aliens]).tobytes(),
+        array('i', [alien.rect.x for alien in aliens]).tobytes(),
+        array('i', [alien.rect.y for alien in aliens]).tobytes(),
+        spawn.tobytes(),
+    ))
+
+
+def _read(blob, offset, typecode, count):
+    """Читает count значений типа typecode с позиции offset; возвращает их и новую позицию"""
+    values = array(typecode)
+    end = offset + count * values.itemsize
+    values.frombytes(blob[offset:end])
+    return values, end
+
+
+def restore(ai_game, blob):
+    """Переносит снимок blob в игру ai_game"""
+    magic, version, width, height = HEADER.unpack_from(blob)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("это не снимок Alien Invasion или неподдерживаемая версия")
+    settings = ai_game.settings
+    if (width, height) != (settings.screen_width, settings.screen_height):
+        raise ValueError(f"снимок сделан для поля {width}x{height}, а не "
+                         f"{settings.screen_width}x{settings.screen_height}")
+
+    (state, respawn_timer, ships_left, score, level, high_score,
+     settings.ship_speed_factor, settings.bullet_speed_factor, settings.alien_speed_factor,
+     settings.fleet_direction, settings.alien_points, ai_game.fire_cooldown_ticks,
+     ship_x, ship_y, ship_rect_x, ship_rect_y,
+     bullet_count, alien_count, spawn_count) = STATE.unpack_from(blob, HEADER.size)
+
+    offset = HEADER.size + STATE.size
+    bullet_y, offset = _read(blob, offset, 'd', bullet_count)
+    bullet_x, offset = _read(blob, offset, 'i', bullet_count)
+    bullet_rect_y, offset = _read(blob, offset, 'i', bullet_count)
+    alien_x, offset = _read(blob, offset, 'd', alien_count)
+    alien_rect_x, offset = _read(blob, offset, 'i', alien_count)
+    alien_rect_y, offset = _read(blob, offset, 'i', alien_count)
+    spawn, offset = _read(blob, offset, 'i', 2 * spawn_count)
+
+    stats = ai_game.stats
+    stats.state = STATES[state]
+    stats.respawn_timer = respawn_timer
+
+    # Панель счета перерисовывается только для изменившихся значений.
+    sb = ai_game.sb
+    if stats.score != score:
+        stats.score = score
+        sb.prep_score()
+    if stats.high_score != high_score:
+        stats.high_score = high_score
+        sb.prep_high_score()
+    if stats.level != level:
+        stats.level = level
+        sb.prep_level()
+    if stats.ships_left != ships_left:
+        stats.ships_left = ships_left
+        sb.prep_ships()
+
+    ship = ai_game.ship
+    ship.x, ship.y = ship_x, ship_y
+    ship.rect.topleft = (ship_rect_x, ship_rect_y)
+
+    ai_game.bullets.restore(zip(bullet_x, bullet_rect_y, bullet_y))
+
+    # Пришельцы текущего флота получают новые позиции: лишние удаляются,
+    # недостающие копируются с прототипа.
+    fleet = ai_game.aliens
+    surplus = len(fleet) - alien_count
+    if surplus > 0:
+        fleet.remove(fleet.sprites()[alien_count:])
+    elif surplus < 0:
+        prototype = ai_game.alien_prototype
+        fleet.add([prototype.copy_at(0, 0) for _ in range(-surplus)])
+    fleet.place(alien_x, alien_rect_x, alien_rect_y)
+
+    ai_game.spawn_queue.clear()
+    ai_game.spawn_queue.extend(zip(spawn[::2], spawn[1::2]))
+
+    if ai_game.dirty_renderer is not None:
+        ai_game.dirty_renderer.request_full_redraw()
+
+
+class SnapshotRing:
+    """Кольцевой буфер последних снимков, занимающий не больше max_bytes.
+
+    Снимок делается каждые interval тиков; самые старые снимки
+    вытесняются, когда суммарный размер превышает max_bytes.
+    """
+
+    def __init__(self, ai_game, interval, max_bytes):
+        """Инициализирует пустой буфер"""
+        self.ai_game = ai_game
+        self.interval = interval
+        self.max_bytes = max_bytes
+
+        self.snapshots = deque()
+        self.size = 0
+        self.ticks = 0
+
+    def record(self):
+        """Учитывает тик; каждые interval тиков сохраняет снимок"""
+        self.ticks += 1
+        if self.ticks % self.interval:
+            return
+        blob = capture(self.ai_game)
+        self.snapshots.append(blob)
+        self.size += len(blob)
+        while self.size > self.max_bytes and len(self.snapshots) > 1:
+            self.size -= len(self.snapshots.popleft())
+
+    def rewind(self, steps=1):
+        """Возвращает игру на steps снимков назад; более новые снимки отбрасываются.
+
+        Восстановленный снимок остается в буфере. Возвращает False,
+        если сохраненных снимков нет.
+        """
+        if not self.snapshots:
+            return False
+        for _ in range(steps):
+            if len(self.snapshots) > 1:
+                self.size -= len(self.snapshots.pop())
+        restore(self.ai_game, self.snapshots[-1])
+        self.ticks = 0
+        return True
+
+    def clear(self):
+        """Удаляет все снимки"""
+        self.snapshots.clear()
+        self.size = 0
+        self.ticks = 0
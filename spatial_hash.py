@@ -0,0 +1,73 @@
+class SpatialHash:
+    """Равномерная сетка для быстрого поиска спрайтов рядом с прямоугольником.
+
+    Спрайты раскладываются по ячейкам один раз. Если после этого все они
+    сдвигаются одинаково (как флот пришельцев), сетку не нужно перестраивать:
+    запрос переводится в координаты построения по сдвигу любого из спрайтов.
+    """
+
+    def __init__(self, cell_width, cell_height, margin=1):
+        """Инициализирует пустую сетку с ячейками cell_width x cell_height.
+
+        margin - запас в пикселах вокруг запроса на случай, если округление
+        сдвинуло отдельные спрайты на пиксел относительно остальных.
+        """
+        self.cell_width = max(1, cell_width)
+        self.cell_height = max(1, cell_height)
+        self.margin = margin
+        self.cells = {}
+        self.order = {}
+        self.built_rects = {}
+
+    def _cells_for(self, rect):
+        """Перебирает ячейки, которые накрывает прямоугольник"""
+        left = rect.left // self.cell_width
+        right = (rect.right - 1) // self.cell_width
+        top = rect.top // self.cell_height
+        bottom = (rect.bottom - 1) // self.cell_height
+        for cell_x in range(left, right + 1):
+            for cell_y in range(top, bottom + 1):
+                yield cell_x, cell_y
+
+    def build(self, sprites):
+        """Раскладывает спрайты по ячейкам, запоминая их порядок в группе"""
+        self.cells = {}
+        self.order = {}
+        self.built_rects = {}
+        for index, sprite in enumerate(sprites):
+            self.order[sprite] = index
+            self.built_rects[sprite] = sprite.rect.copy()
+            for cell in self._cells_for(sprite.rect):
+                self.cells.setdefault(cell, []).append(sprite)
+
+    def remove(self, sprite):
+        """Убирает спрайт из сетки"""
+        built_rect = self.built_rects.pop(sprite, None)
+        if built_rect is None:
+            return
+        del self.order[sprite]
+        for cell in self._cells_for(built_rect):
+            self.cells[cell].remove(sprite)
+
+    def offset(self):
+        """Возвращает сдвиг спрайтов с момента построения сетки"""
+        for sprite, built_rect in self.built_rects.items():
+            return sprite.rect.x - built_rect.x, sprite.rect.y - built_rect.y
+        return 0, 0
+
+    def query(self, rect, offset=None):
+        """Возвращает спрайты из ячеек рядом с rect в порядке группы.
+
+        offset - заранее посчитанный сдвиг, если запросов несколько подряд.
+        """
+        if not self.built_rects:
+            return []
+        dx, dy = offset if offset is not None else self.offset()
+        area = rect.move(-dx, -dy).inflate(2 * self.margin, 2 * self.margin)
+
+        found = set()
+        for cell in self._cells_for(area):
+            bucket = self.cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return sorted(found, key=self.order.__getitem__)
@@ -0,0 +1,177 @@
+from collections import OrderedDict
+
+import pygame
+
+# Символы панели счета: цифры, разделители разрядов и знаки между числами.
+SCORE_CHARSET = "0123456789,. :/-"
+
+
+class TextRenderer:
+    """Класс для вывода текста из заранее отрисованных символов.
+
+    Символы charset один раз растеризуются шрифтом в общий атлас,
+    и тогда же измеряется шаг пера для каждой пары символов (с дробной
+    частью и кернингом, в 1/64 пиксела). Строка из этих символов
+    собирается копированием глифов из атласа в позиции, которые считаются
+    сложением шагов, поэтому результат совпадает с font.render попиксельно,
+    а шрифт при выводе не вызывается вовсе. render_into() собирает строку
+    в переданную поверхность, которая пересоздается, только если текст
+    в нее не помещается. render() хранит последние собранные строки
+    в кэше LRU. Строки с другими символами выводятся через font.render.
+    """
+
+    def __init__(self, font, text_color, bg_color, charset=SCORE_CHARSET, max_cached=32):
+        """Строит атлас символов charset для шрифта font"""
+        self.font = font
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.max_cached = max_cached
+
+        self.glyphs = {}
+        self.steps = {}
+
+        # Соседние глифы могут перекрываться полями, поэтому глифы накладываются
+        # смешиванием: темный текст на светлом фоне - минимумом каналов,
+        # светлый на темном - максимумом. При смешанных цветах атлас не строится.
+        if all(t <= b for t, b in zip(text_color, bg_color)):
+            self.blend = pygame.BLEND_RGB_MIN
+        elif all(t >= b for t, b in zip(text_color, bg_color)):
+            self.blend = pygame.BLEND_RGB_MAX
+        else:
+            charset = ""
+        charset = "".join(dict.fromkeys(charset))
+        if charset and not self._measure_steps(charset):
+            charset = ""
+        self.height = max([font.size(char)[1] for char in charset] + [font.get_height()])
+        self.atlas = self._build_atlas(charset)
+        # Фон для очистки места под строку: блит быстрее fill().
+        self.blank = self._new_surface((1, self.height))
+        self.blank.fill(bg_color)
+
+        self.cached = OrderedDict()
+
+        # Счетчики позволяют проверить, что шрифт не растеризуется каждый кадр.
+        self.compose_count = 0
+        self.font_render_count = 0
+        self.hit_count = 0
+
+    def _measure_steps(self, charset):
+        """Измеряет шаги пера self.steps для всех пар символов charset.
+
+        Шрифт ставит глиф в целую часть позиции пера, а позиция копится
+        в 1/64 пиксела. Шаг пары из целой и дробной частей определяется
+        по font.size: строка из 64 одинаковых шагов приходит в целый
+        пиксел, а символ sweep с нечетным шагом, повторенный k раз, дает
+        перу любую дробную часть, по которой двоичным поиском находится
+        дробная часть шага. Возвращает False, если такого символа нет.
+        """
+        size = self.font.size
+        widths = {char: size(char)[0] for char in charset}
+
+        def pen_x(text):
+            """Целая позиция пера последнего символа text"""
+            return size(text)[0] - widths[text[-1]]
+
+        repeat = {char: pen_x(char * 65) for char in charset}
+        sweep = next((char for char in charset if repeat[char] % 2), None)
+        if sweep is None:
+            return False
+        # Число повторов sweep, после которых дробная часть пера равна индексу.
+        repeats = {k * repeat[sweep] % 64: k for k in range(64)}
+
+        steps = self.steps
+        for first in [sweep] + [char for char in charset if char != sweep]:
+            # Шаг от sweep к first известен, поэтому дробная часть пера
+            # перед first задается числом повторов sweep.
+            offset = 0 if first == sweep else steps[sweep, first]
+            tail = "" if first == sweep else first
+            for second in charset:
+                whole = pen_x(first + second)
+                # Наименьшая дробная часть пера, при которой шаг дает перенос.
+                low, high = 1, 64
+                while low < high:
+                    phase = (low + high) // 2
+                    k = repeats[(phase - offset) % 64]
+                    pen = k * repeat[sweep] + offset
+                    if pen_x(sweep * (k + 1) + tail + second) - (pen >> 6) > whole:
+                        high = phase
+                    else:
+                        low = phase + 1
+                steps[first, second] = 64 * whole + (64 - low) % 64
+        return True
+
+    def _build_atlas(self, charset):
+        """Рисует символы charset в одну поверхность и запоминает их области"""
+        images = []
+        x = 0
+        for char in charset:
+            image = self.font.render(char, True, self.text_color, self.bg_color)
+            self.glyphs[char] = pygame.Rect((x, 0), image.get_size())
+            images.append(image)
+            x += image.get_width()
+
+        atlas = self._new_surface((max(1, x), self.height))
+        atlas.fill(self.bg_color)
+        for image, char in zip(images, self.glyphs):
+            atlas.blit(image, self.glyphs[char])
+        return atlas
+
+    def _new_surface(self, size):
+        """Создает поверхность в формате экрана, если окно уже создано"""
+        surface = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        return surface
+
+    def render(self, text):
+        """Возвращает поверхность с текстом text.
+
+        Поверхность общая для всех, кто выводит ту же строку, ее нельзя изменять.
+        """
+        image = self.cached.get(text)
+        if image is not None:
+            self.cached.move_to_end(text)
+            self.hit_count += 1
+            return image
+
+        image, _ = self.render_into(text)
+        self.cached[text] = image
+        if len(self.cached) > self.max_cached:
+            self.cached.popitem(last=False)
+        return image
+
+    def render_into(self, text, surface=None):
+        """Выводит text в левый верхний угол surface.
+
+        Возвращает поверхность и область текста на ней. Если surface не
+        задана или уже текста, возвращается новая поверхность по размеру текста.
+        """
+        glyphs = self.glyphs
+        if not text or not all(char in glyphs for char in text):
+            self.font_render_count += 1
+            image = self.font.render(text, True, self.text_color, self.bg_color)
+            return image, image.get_rect()
+
+        steps = self.steps
+        atlas = self.atlas
+        blend = self.blend
+        pen = 0
+        previous = None
+        commands = []
+        for char in text:
+            if previous is not None:
+                pen += steps[previous, char]
+            area = glyphs[char]
+            commands.append((atlas, (pen >> 6, 0), area, blend))
+            previous = char
+
+        text_area = pygame.Rect(0, 0, (pen >> 6) + area.width, self.height)
+        if self.blank.get_width() < text_area.width:
+            self.blank = self._new_surface(text_area.size)
+            self.blank.fill(self.bg_color)
+        if surface is None or surface.get_width() < text_area.width:
+            surface = self._new_surface(text_area.size)
+        surface.blit(self.blank, (0, 0), text_area)
+        surface.blits(commands, doreturn=False)
+        self.compose_count += 1
+        return surface, text_area
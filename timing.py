@@ -0,0 +1,64 @@
+import time
+
+
+class RateCounter:
+    """Класс для подсчета фактической частоты тиков и кадров."""
+
+    def __init__(self, interval=1.0):
+        """Инициализирует счетчики; interval - период усреднения в секундах."""
+        self.interval = interval
+        self.ticks = 0
+        self.frames = 0
+        self.tick_rate = 0.0
+        self.frame_rate = 0.0
+        self._started = time.perf_counter()
+
+    def count_tick(self):
+        """Учитывает один шаг симуляции."""
+        self.ticks += 1
+
+    def count_frame(self):
+        """Учитывает один кадр и возвращает True, если частоты пересчитаны."""
+        self.frames += 1
+        now = time.perf_counter()
+        elapsed = now - self._started
+        if elapsed < self.interval:
+            return False
+
+        self.tick_rate = self.ticks / elapsed
+        self.frame_rate = self.frames / elapsed
+        self.ticks = 0
+        self.frames = 0
+        self._started = now
+        return True
+
+
+class StartupTimer:
+    """Класс для замера этапов запуска игры до первого кадра."""
+
+    def __init__(self):
+        """Инициализирует замер; отсчет этапов идет с момента создания."""
+        self.stages = {}
+        self._last = time.perf_counter()
+
+    def add(self, stage, seconds):
+        """Записывает этап, время которого измерено отдельно."""
+        self.stages[stage] = seconds
+
+    def mark(self, stage):
+        """Относит время с предыдущей отметки к этапу stage."""
+        now = time.perf_counter()
+        self.stages[stage] = now - self._last
+        self._last = now
+
+    def total(self):
+        """Возвращает суммарное время всех этапов в секундах."""
+        return sum(self.stages.values())
+
+    def report(self, budget):
+        """Возвращает строки отчета; budget - допустимое время запуска в секундах."""
+        lines = [f"{stage:12} {seconds * 1000:8.1f} ms" for stage, seconds in self.stages.items()]
+        total = self.total()
+        verdict = "ok" if total <= budget else "OVER BUDGET"
+        lines.append(f"{'total':12} {total * 1000:8.1f} ms (budget {budget * 1000:.0f} ms, {verdict})")
+        return lines
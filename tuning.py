@@ -0,0 +1,217 @@
+"""Пакетный прогон игр для подбора кривой сложности.
+
+Для каждого сочетания перебираемых настроек (--set, --score-scales)
+запускается несколько игр в режиме headless в пуле процессов. Без
+явных настроек перебирается скорость флота alien_speed. Игрой управляет
+простой агент, игра идет до поражения или до предела тиков. Отчет
+содержит уровни, счет и скорость симуляции по каждому варианту настроек.
+
+Множители *_speed_factor игра не использует, поэтому speedup_scale
+на ход игры не влияет и отдельного ключа для перебора не имеет.
+
+Примеры запуска:
+    python tuning.py --games 200 --output tuning.json
+    python tuning.py --score-scales 1.5 2.0 --agent tracker
+    python tuning.py --set alien_speed=150,200,250 --set fleet_drop_speed=5,10
+"""
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from settings import Settings
+
+# Перебираемые настройки, если ни одна не задана в командной строке.
+DEFAULT_AXES = {'alien_speed': [150.0, 200.0, 250.0]}
+
+
+def random_agent(ai, rng):
+    """Агент, который стреляет непрерывно и двигается случайно"""
+    return rng.choice(({'left', 'hold_fire'}, {'right', 'hold_fire'}, {'hold_fire'}))
+
+
+def tracker_agent(ai, rng):
+    """Агент, который держится под ближайшим по горизонтали пришельцем и стреляет.
+
+    Прицел сбивается на случайную величину, а иногда агент не успевает
+    среагировать, поэтому игры с разными зернами различаются.
+    """
+    if rng.random() < 0.1:
+        return {'hold_fire'}
+    ship_x = ai.ship.rect.centerx + rng.randint(-20, 20)
+    target = min((alien.rect.centerx for alien in ai.aliens),
+                 key=lambda x: abs(x - ship_x), default=ship_x)
+    if target < ship_x - 2:
+        return {'left', 'hold_fire'}
+    if target > ship_x + 2:
+        return {'right', 'hold_fire'}
+    return {'hold_fire'}
+
+
+AGENTS = {'random': random_agent, 'tracker': tracker_agent}
+
+
+def play_game(job):
+    """Играет одну игру и возвращает ее итог.
+
+    Вызывается в процессе пула, поэтому принимает и возвращает простые данные.
+    """
+    # Импорт здесь, чтобы SDL_VIDEODRIVER был задан до инициализации pygame.
+    from alien_invasion import AlienInvasion
+
+    settings = Settings()
+    for name, value in job['settings'].items():
+        setattr(settings, name, value)
+    agent = AGENTS[job['agent']]
+    rng = random.Random(job['seed'])
+
+    # increase_speed печатает стоимость пришельцев, в пакетном прогоне это не нужно.
+    with contextlib.redirect_stdout(io.StringIO()):
+        ai = AlienInvasion(settings=settings, headless=True)
+        ai.step({'play'})
+        ticks = 0
+        start = time.perf_counter()
+        while ai.stats.game_active and ticks < job['max_ticks']:
+            ai.step(agent(ai, rng))
+            ticks += 1
+        elapsed = time.perf_counter() - start
+
+    return {
+        'variant': job['variant'],
+        'level': ai.stats.level,
+        'score': ai.stats.score,
+        'ticks': ticks,
+        'seconds': elapsed,
+        'game_over': not ai.stats.game_active,
+    }
+
+
+def make_jobs(axes, games, agent, max_ticks, seed, overrides):
+    """Строит задания: games игр на каждое сочетание значений настроек.
+
+    axes - словарь {имя настройки: список значений}.
+    """
+    jobs = []
+    names = list(axes)
+    for values in itertools.product(*axes.values()):
+        variant = "/".join(f"{name}={value}" for name, value in zip(names, values))
+        settings = dict(overrides, **dict(zip(names, values)))
+        for game in range(games):
+            jobs.append({
+                'variant': variant,
+                'settings': settings,
+                'agent': agent,
+                'seed': seed + game,
+                'max_ticks': max_ticks,
+            })
+    return jobs
+
+
+def summarize(results):
+    """Сводит итоги игр по вариантам настроек"""
+    variants = {}
+    for result in results:
+        variants.setdefault(result['variant'], []).append(result)
+
+    report = {}
+    for variant, games in variants.items():
+        levels = sorted(game['level'] for game in games)
+        ticks = sum(game['ticks'] for game in games)
+        seconds = sum(game['seconds'] for game in games)
+        report[variant] = {
+            'games': len(games),
+            'level_mean': sum(levels) / len(levels),
+            'level_median': levels[len(levels) // 2],
+            'level_max': levels[-1],
+            'score_mean': sum(game['score'] for game in games) / len(games),
+            'score_max': max(game['score'] for game in games),
+            'ticks_mean': ticks / len(games),
+            'ticks_per_second': ticks / seconds if seconds else 0.0,
+            'unfinished': sum(not game['game_over'] for game in games),
+        }
+    return report
+
+
+def parse_axis(value):
+    """Разбирает строку вида alien_speed=150,200 в имя и список значений"""
+    name, _, values = value.partition("=")
+    if not name or not values:
+        raise argparse.ArgumentTypeError(f"ожидается NAME=V1,V2,...: {value}")
+    return name, [json.loads(item) for item in values.split(",")]
+
+
+def run_batch(jobs, workers):
+    """Прогоняет задания в пуле из workers процессов"""
+    # Задания мелкие, пачки снижают накладные расходы на передачу между процессами.
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(play_game, jobs, chunksize=chunksize))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пакетный прогон игр Alien Invasion для настройки сложности")
+    parser.add_argument("--score-scales", nargs="+", type=float,
+                        help="значения Settings.score_scale")
+    parser.add_argument("--set", dest="axes", action="append", type=parse_axis, default=[],
+                        metavar="NAME=V1,V2", help="перебирать значения еще одной настройки")
+    parser.add_argument("--games", type=int, default=50,
+                        help="число игр на каждый вариант настроек")
+    parser.add_argument("--agent", choices=sorted(AGENTS), default="tracker")
+    parser.add_argument("--max-ticks", type=int, default=100_000,
+                        help="предел тиков на одну игру")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(),
+                        help="число процессов (по умолчанию по числу ядер)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fleet-engine", choices=("sprites", "numpy"), default="sprites",
+                        help="способ хранения флота (Settings.fleet_engine)")
+    parser.add_argument("--output", default="tuning_output.json",
+                        help="файл для отчета в формате JSON")
+    args = parser.parse_args(argv)
+
+    # Дочерние процессы наследуют окружение и не открывают окно.
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+    axes = {}
+    if args.score_scales:
+        axes['score_scale'] = args.score_scales
+    axes.update(args.axes)
+    if not axes:
+        axes = dict(DEFAULT_AXES)
+    jobs = make_jobs(axes, args.games, args.agent, args.max_ticks, args.seed,
+                     {'fleet_engine': args.fleet_engine})
+    start = time.perf_counter()
+    results = run_batch(jobs, args.workers)
+    elapsed = time.perf_counter() - start
+
+    total_ticks = sum(result['ticks'] for result in results)
+    report = {
+        "meta": {
+            "games": len(jobs),
+            "workers": args.workers,
+            "agent": args.agent,
+            "seconds": elapsed,
+            "ticks_per_second": total_ticks / elapsed if elapsed else 0.0,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "variants": summarize(results),
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    for variant, stats in report["variants"].items():
+        print(f"{variant}: level {stats['level_mean']:.2f} (max {stats['level_max']}), "
+              f"score {stats['score_mean']:.0f}, {stats['ticks_per_second']:.0f} ticks/s")
+    print(f"{len(jobs)} games in {elapsed:.1f} s with {args.workers} workers, "
+          f"{report['meta']['ticks_per_second']:.0f} ticks/s overall")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())